@@ -1,12 +1,13 @@
 """Pokemon stat calculator using VGC Level 50 formulas."""
 
 import math
+from collections.abc import Mapping
 
 from smogon_vgc_mcp.data.pokemon_data import (
     get_base_stats,
     get_nature_multiplier,
 )
-from smogon_vgc_mcp.utils import parse_ev_string, parse_iv_string
+from smogon_vgc_mcp.utils import DEFAULT_IVS, parse_ev_string, parse_iv_string
 
 
 def calculate_hp(base: int, iv: int, ev: int, level: int = 50) -> int:
@@ -36,8 +37,8 @@ def calculate_stat(
 
 def calculate_all_stats(
     pokemon: str,
-    evs: str | dict,
-    ivs: str | dict | None = None,
+    evs: str | Mapping[str, int],
+    ivs: str | Mapping[str, int] | None = None,
     nature: str = "Hardy",
     level: int = 50,
 ) -> dict | None:
@@ -62,7 +63,7 @@ def calculate_all_stats(
     if isinstance(evs, str):
         evs = parse_ev_string(evs)
     if ivs is None:
-        ivs = {"hp": 31, "atk": 31, "def": 31, "spa": 31, "spd": 31, "spe": 31}
+        ivs = DEFAULT_IVS
     elif isinstance(ivs, str):
         ivs = parse_iv_string(ivs)
 
@@ -1,16 +1,46 @@
 """Type analysis for Pokemon and teams."""
 
 from collections import defaultdict
+from functools import lru_cache
 
 from smogon_vgc_mcp.data.pokemon_data import (
     ALL_TYPES,
+    get_defensive_multipliers,
+    get_offensive_multipliers,
     get_pokemon_types,
     get_resistances,
-    get_type_effectiveness,
     get_weaknesses,
 )
 
 
+@lru_cache(maxsize=2048)
+def _weakness_profile(pokemon: str) -> tuple[tuple[str, ...], ...] | None:
+    """Build the categorized type matchups for a Pokemon.
+
+    Species typing is static, so the result is cached per name and returned
+    as tuples; callers copy it into fresh lists before handing it out.
+
+    Returns:
+        (types, 4x_weak, 2x_weak, resists, 4x_resists, immunities), or None
+        if the Pokemon is not found
+    """
+    types = get_pokemon_types(pokemon)
+    if not types:
+        return None
+
+    weaknesses = get_weaknesses(pokemon)
+    resistances = get_resistances(pokemon)
+
+    return (
+        tuple(types),
+        tuple(t for t, m in weaknesses if m == 4),
+        tuple(t for t, m in weaknesses if m == 2),
+        tuple(t for t, m in resistances if m == 0.5),
+        tuple(t for t, m in resistances if m == 0.25),
+        tuple(t for t, m in resistances if m == 0),
+    )
+
+
 def get_pokemon_weaknesses(pokemon: str) -> dict:
     """Get detailed weakness information for a Pokemon.
 
@@ -20,28 +50,20 @@ def get_pokemon_weaknesses(pokemon: str) -> dict:
     Returns:
         Dict with types and weakness info
     """
-    types = get_pokemon_types(pokemon)
-    if not types:
+    profile = _weakness_profile(pokemon)
+    if profile is None:
         return {"error": f"Pokemon '{pokemon}' not found"}
 
-    weaknesses = get_weaknesses(pokemon)
-    resistances = get_resistances(pokemon)
-
-    # Categorize
-    quad_weak = [(t, m) for t, m in weaknesses if m == 4]
-    double_weak = [(t, m) for t, m in weaknesses if m == 2]
-    resists = [(t, m) for t, m in resistances if m == 0.5]
-    quad_resists = [(t, m) for t, m in resistances if m == 0.25]
-    immunities = [(t, m) for t, m in resistances if m == 0]
+    types, quad_weak, double_weak, resists, quad_resists, immunities = profile
 
     return {
         "pokemon": pokemon,
-        "types": types,
-        "4x_weak": [t for t, _ in quad_weak],
-        "2x_weak": [t for t, _ in double_weak],
-        "resists": [t for t, _ in resists],
-        "4x_resists": [t for t, _ in quad_resists],
-        "immunities": [t for t, _ in immunities],
+        "types": list(types),
+        "4x_weak": list(quad_weak),
+        "2x_weak": list(double_weak),
+        "resists": list(resists),
+        "4x_resists": list(quad_resists),
+        "immunities": list(immunities),
     }
 
 
@@ -86,8 +108,7 @@ def analyze_team_types(pokemon_list: list[str]) -> dict:
         pokemon_types[pokemon] = types
 
         # Check each attacking type
-        for atk_type in ALL_TYPES:
-            mult = get_type_effectiveness(atk_type, types)
+        for atk_type, mult in zip(ALL_TYPES, get_defensive_multipliers(types)):
             if mult > 1:
                 team_weaknesses[atk_type].append(pokemon)
             elif mult == 0:
@@ -134,8 +155,7 @@ def get_offensive_coverage(move_types: list[str]) -> dict:
     immune_to: dict[str, list[str]] = defaultdict(list)
 
     for move_type in move_types:
-        for def_type in ALL_TYPES:
-            mult = get_type_effectiveness(move_type, [def_type])
+        for def_type, mult in zip(ALL_TYPES, get_offensive_multipliers(move_type)):
             if mult > 1:
                 hits_super_effective[def_type].append(move_type)
             elif mult == 0:
@@ -2,11 +2,14 @@
 
 from smogon_vgc_mcp.data.pokemon_data import (
     ALL_TYPES,
+    ALL_TYPES_SET,
     NATURE_MODIFIERS,
     TYPE_CHART,
     get_base_stats,
+    get_defensive_multipliers,
     get_nature_modifiers,
     get_nature_multiplier,
+    get_offensive_multipliers,
     get_pokemon_types,
     get_resistances,
     get_type_effectiveness,
@@ -16,11 +19,14 @@ from smogon_vgc_mcp.data.pokemon_data import (
 
 __all__ = [
     "ALL_TYPES",
+    "ALL_TYPES_SET",
     "NATURE_MODIFIERS",
     "TYPE_CHART",
     "get_base_stats",
+    "get_defensive_multipliers",
     "get_nature_modifiers",
     "get_nature_multiplier",
+    "get_offensive_multipliers",
     "get_pokemon_types",
     "get_resistances",
     "get_type_effectiveness",
@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import json
+from functools import cache, lru_cache
 from pathlib import Path
 
-ALL_TYPES = [
+ALL_TYPES: tuple[str, ...] = (
     "Normal", "Fire", "Water", "Electric", "Grass", "Ice",
     "Fighting", "Poison", "Ground", "Flying", "Psychic", "Bug",
-    "Rock", "Ghost", "Dragon", "Dark", "Steel", "Fairy"
-]
+    "Rock", "Ghost", "Dragon", "Dark", "Steel", "Fairy",
+)
+
+# Membership checks for type names (validation) without scanning ALL_TYPES
+ALL_TYPES_SET: frozenset[str] = frozenset(ALL_TYPES)
 
 TYPE_CHART: dict[str, dict[str, float]] = {
     "Normal": {"Rock": 0.5, "Ghost": 0, "Steel": 0.5},
@@ -62,6 +66,17 @@ TYPE_CHART: dict[str, dict[str, float]] = {
     "Fairy": {"Fire": 0.5, "Fighting": 2, "Poison": 0.5, "Dragon": 2, "Dark": 2, "Steel": 0.5},
 }
 
+_TYPE_INDEX: dict[str, int] = {t: i for i, t in enumerate(ALL_TYPES)}
+
+# Dense 18x18 effectiveness matrix indexed by _TYPE_INDEX: row = attacking type,
+# column = defending type. Built once from TYPE_CHART; lookups use it directly.
+_OFFENSIVE_ROWS: tuple[tuple[float, ...], ...] = tuple(
+    tuple(TYPE_CHART[atk].get(def_type, 1.0) for def_type in ALL_TYPES) for atk in ALL_TYPES
+)
+
+# Per defending type, the multiplier of every attacking type (in ALL_TYPES order)
+_DEFENSIVE_COLUMNS: tuple[tuple[float, ...], ...] = tuple(zip(*_OFFENSIVE_ROWS))
+
 NATURE_MODIFIERS: dict[str, tuple[str, str] | None] = {
     "hardy": None,
     "lonely": ("atk", "def"),
@@ -90,34 +105,29 @@ NATURE_MODIFIERS: dict[str, tuple[str, str] | None] = {
     "quirky": None,
 }
 
-_base_stats: dict[str, dict[str, int]] | None = None
-_types: dict[str, list[str]] | None = None
+# Per nature, the multiplier for each boosted/reduced stat; absent stats are 1.0
+_NATURE_MULTIPLIERS: dict[str, dict[str, float]] = {
+    nature: {mods[0]: 1.1, mods[1]: 0.9} if mods else {}
+    for nature, mods in NATURE_MODIFIERS.items()
+}
 
 
 def _get_data_path() -> Path:
     return Path(__file__).parent
 
 
+@cache
 def _load_base_stats() -> dict[str, dict[str, int]]:
-    global _base_stats
-    if _base_stats is not None:
-        return _base_stats
-
     path = _get_data_path() / "base_stats.json"
     with open(path) as f:
-        _base_stats = json.load(f)
-    return _base_stats
+        return json.load(f)
 
 
+@cache
 def _load_types() -> dict[str, list[str]]:
-    global _types
-    if _types is not None:
-        return _types
-
     path = _get_data_path() / "types.json"
     with open(path) as f:
-        _types = json.load(f)
-    return _types
+        return json.load(f)
 
 
 def normalize_pokemon_name(name: str) -> str:
@@ -125,6 +135,7 @@ def normalize_pokemon_name(name: str) -> str:
     return name.lower().replace(" ", "").replace("-", "")
 
 
+@lru_cache(maxsize=1024)
 def get_base_stats(pokemon: str) -> dict[str, int] | None:
     """Get base stats for a Pokemon.
 
@@ -135,6 +146,7 @@ def get_base_stats(pokemon: str) -> dict[str, int] | None:
     return stats.get(normalized)
 
 
+@lru_cache(maxsize=1024)
 def get_pokemon_types(pokemon: str) -> list[str] | None:
     """Get types for a Pokemon.
 
@@ -145,6 +157,18 @@ def get_pokemon_types(pokemon: str) -> list[str] | None:
     return types.get(normalized)
 
 
+def _clear_lookup_caches() -> None:
+    """Forget the loaded species data and this module's memoized lookups on it.
+
+    Caches in other modules keyed on species (e.g. calculator.types) are not
+    touched; their tests clear them separately.
+    """
+    _load_base_stats.cache_clear()
+    _load_types.cache_clear()
+    get_base_stats.cache_clear()
+    get_pokemon_types.cache_clear()
+
+
 def get_nature_modifiers(nature: str) -> tuple[str, str] | None:
     """Get nature stat modifiers.
 
@@ -158,16 +182,10 @@ def get_nature_multiplier(nature: str, stat: str) -> float:
 
     Returns 1.1 for boosted, 0.9 for reduced, 1.0 for neutral.
     """
-    mods = get_nature_modifiers(nature)
-    if mods is None:
+    multipliers = _NATURE_MULTIPLIERS.get(nature.lower())
+    if multipliers is None:
         return 1.0
-
-    boosted, reduced = mods
-    if stat == boosted:
-        return 1.1
-    if stat == reduced:
-        return 0.9
-    return 1.0
+    return multipliers.get(stat, 1.0)
 
 
 def get_type_effectiveness(attack_type: str, defending_types: list[str]) -> float:
@@ -180,21 +198,73 @@ def get_type_effectiveness(attack_type: str, defending_types: list[str]) -> floa
     Returns:
         Multiplier (0, 0.25, 0.5, 1, 2, or 4)
     """
-    attack_normalized = attack_type.title()
-    if attack_normalized not in TYPE_CHART:
+    attack_index = _TYPE_INDEX.get(attack_type.title())
+    if attack_index is None:
         return 1.0
 
-    chart = TYPE_CHART[attack_normalized]
+    row = _OFFENSIVE_ROWS[attack_index]
     multiplier = 1.0
 
     for def_type in defending_types:
-        def_normalized = def_type.title()
-        mult = chart.get(def_normalized, 1.0)
-        multiplier *= mult
+        def_index = _TYPE_INDEX.get(def_type.title())
+        if def_index is not None:
+            multiplier *= row[def_index]
 
     return multiplier
 
 
+def get_offensive_multipliers(attack_type: str) -> tuple[float, ...]:
+    """Calculate an attacking type's multiplier against every single type.
+
+    Args:
+        attack_type: The attacking move's type
+
+    Returns:
+        Tuple of multipliers aligned with ALL_TYPES (all 1.0 for unknown types)
+    """
+    index = _TYPE_INDEX.get(attack_type.title())
+    if index is None:
+        return (1.0,) * len(ALL_TYPES)
+    return _OFFENSIVE_ROWS[index]
+
+
+def get_defensive_multipliers(defending_types: list[str]) -> tuple[float, ...]:
+    """Calculate the multiplier of every attacking type against a defender.
+
+    Args:
+        defending_types: List of defending Pokemon's types
+
+    Returns:
+        Tuple of multipliers aligned with ALL_TYPES
+    """
+    return _defensive_row(tuple(t.title() for t in defending_types))
+
+
+@lru_cache(maxsize=512)
+def _defensive_row(defending_types: tuple[str, ...]) -> tuple[float, ...]:
+    # Far fewer distinct typings than species exist, so rows are cached per typing
+    multipliers = (1.0,) * len(ALL_TYPES)
+    for def_type in defending_types:
+        index = _TYPE_INDEX.get(def_type)
+        if index is None:
+            continue
+        column = _DEFENSIVE_COLUMNS[index]
+        multipliers = tuple(m * c for m, c in zip(multipliers, column))
+    return multipliers
+
+
+@lru_cache(maxsize=512)
+def _sorted_matchups(
+    defending_types: tuple[str, ...],
+) -> tuple[tuple[tuple[str, float], ...], tuple[tuple[str, float], ...]]:
+    # (weaknesses by multiplier descending, resistances by multiplier ascending),
+    # filtered and sorted once per typing
+    row = _defensive_row(defending_types)
+    weaknesses = sorted(((t, m) for t, m in zip(ALL_TYPES, row) if m > 1), key=lambda x: -x[1])
+    resistances = sorted(((t, m) for t, m in zip(ALL_TYPES, row) if m < 1), key=lambda x: x[1])
+    return tuple(weaknesses), tuple(resistances)
+
+
 def get_weaknesses(pokemon: str) -> list[tuple[str, float]]:
     """Get types that deal super-effective damage to a Pokemon.
 
@@ -204,13 +274,8 @@ def get_weaknesses(pokemon: str) -> list[tuple[str, float]]:
     if not types:
         return []
 
-    weaknesses = []
-    for attack_type in ALL_TYPES:
-        mult = get_type_effectiveness(attack_type, types)
-        if mult > 1:
-            weaknesses.append((attack_type, mult))
-
-    return sorted(weaknesses, key=lambda x: -x[1])
+    weaknesses, _ = _sorted_matchups(tuple(t.title() for t in types))
+    return list(weaknesses)
 
 
 def get_resistances(pokemon: str) -> list[tuple[str, float]]:
@@ -223,10 +288,5 @@ def get_resistances(pokemon: str) -> list[tuple[str, float]]:
     if not types:
         return []
 
-    resistances = []
-    for attack_type in ALL_TYPES:
-        mult = get_type_effectiveness(attack_type, types)
-        if mult < 1:
-            resistances.append((attack_type, mult))
-
-    return sorted(resistances, key=lambda x: x[1])
+    _, resistances = _sorted_matchups(tuple(t.title() for t in types))
+    return list(resistances)
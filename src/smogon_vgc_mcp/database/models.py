@@ -14,7 +14,7 @@ ChampionsSourceType = Literal["sheet", "pokepaste", "x", "blog"]
 ChampionsIngestionStatus = Literal["auto", "review_pending", "labeled"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Snapshot:
     """Metadata about a stats snapshot."""
 
@@ -26,7 +26,7 @@ class Snapshot:
     fetched_at: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AbilityUsage:
     """Ability usage data."""
 
@@ -35,7 +35,7 @@ class AbilityUsage:
     percent: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemUsage:
     """Item usage data."""
 
@@ -44,7 +44,7 @@ class ItemUsage:
     percent: float
 
 
-@dataclass
+@dataclass(slots=True)
 class MoveUsage:
     """Move usage data."""
 
@@ -53,7 +53,7 @@ class MoveUsage:
     percent: float
 
 
-@dataclass
+@dataclass(slots=True)
 class TeammateUsage:
     """Teammate usage data."""
 
@@ -62,7 +62,7 @@ class TeammateUsage:
     percent: float
 
 
-@dataclass
+@dataclass(slots=True)
 class EVSpread:
     """EV spread data."""
 
@@ -77,7 +77,7 @@ class EVSpread:
     percent: float
 
 
-@dataclass
+@dataclass(slots=True)
 class TeraTypeUsage:
     """Tera Type usage data (from moveset txt files)."""
 
@@ -85,7 +85,7 @@ class TeraTypeUsage:
     percent: float
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckCounter:
     """Check/Counter data (from moveset txt files)."""
 
@@ -96,7 +96,7 @@ class CheckCounter:
     switch_percent: float
 
 
-@dataclass
+@dataclass(slots=True)
 class PokemonStats:
     """Complete stats for a Pokemon."""
 
@@ -113,7 +113,7 @@ class PokemonStats:
     checks_counters: list[CheckCounter] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class UsageRanking:
     """Pokemon usage ranking entry."""
 
@@ -123,7 +123,7 @@ class UsageRanking:
     raw_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamPokemon:
     """A Pokemon on a tournament team (parsed from pokepaste)."""
 
@@ -151,7 +151,7 @@ class TeamPokemon:
     move4: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Team:
     """A tournament team from the pokepaste repository."""
 
@@ -174,7 +174,7 @@ class Team:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class DexPokemon:
     """Pokemon species data from the Pokedex."""
 
@@ -194,7 +194,7 @@ class DexPokemon:
     forme: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DexMove:
     """Move data from the Pokedex."""
 
@@ -212,7 +212,7 @@ class DexMove:
     short_desc: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DexAbility:
     """Ability data from the Pokedex."""
 
@@ -224,7 +224,7 @@ class DexAbility:
     rating: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class DexItem:
     """Item data from the Pokedex."""
 
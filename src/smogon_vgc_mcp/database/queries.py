@@ -129,117 +129,64 @@ async def get_pokemon_stats(
         # Parse viability ceiling
         viability = json.loads(pokemon_row["viability_ceiling"] or "[]")
 
+        # Rows are fetched in one batch per table and the columns are selected in
+        # dataclass field order, so each row maps positionally onto its model.
+
         # Get abilities
-        abilities = []
         async with db.execute(
-            "SELECT * FROM abilities WHERE pokemon_usage_id = ? ORDER BY count DESC",
+            "SELECT ability, count, percent FROM abilities "
+            "WHERE pokemon_usage_id = ? ORDER BY count DESC",
             (pokemon_usage_id,),
         ) as cursor:
-            async for row in cursor:
-                abilities.append(
-                    AbilityUsage(
-                        ability=row["ability"],
-                        count=row["count"],
-                        percent=row["percent"],
-                    )
-                )
+            abilities = [AbilityUsage(*row) for row in await cursor.fetchall()]
 
         # Get items
-        items = []
         async with db.execute(
-            "SELECT * FROM items WHERE pokemon_usage_id = ? ORDER BY count DESC LIMIT 15",
+            "SELECT item, count, percent FROM items "
+            "WHERE pokemon_usage_id = ? ORDER BY count DESC LIMIT 15",
             (pokemon_usage_id,),
         ) as cursor:
-            async for row in cursor:
-                items.append(
-                    ItemUsage(
-                        item=row["item"],
-                        count=row["count"],
-                        percent=row["percent"],
-                    )
-                )
+            items = [ItemUsage(*row) for row in await cursor.fetchall()]
 
         # Get moves
-        moves = []
         async with db.execute(
-            "SELECT * FROM moves WHERE pokemon_usage_id = ? ORDER BY count DESC LIMIT 15",
+            "SELECT move, count, percent FROM moves "
+            "WHERE pokemon_usage_id = ? ORDER BY count DESC LIMIT 15",
             (pokemon_usage_id,),
         ) as cursor:
-            async for row in cursor:
-                moves.append(
-                    MoveUsage(
-                        move=row["move"],
-                        count=row["count"],
-                        percent=row["percent"],
-                    )
-                )
+            moves = [MoveUsage(*row) for row in await cursor.fetchall()]
 
         # Get teammates
-        teammates = []
         async with db.execute(
-            "SELECT * FROM teammates WHERE pokemon_usage_id = ? ORDER BY count DESC LIMIT 10",
+            "SELECT teammate, count, percent FROM teammates "
+            "WHERE pokemon_usage_id = ? ORDER BY count DESC LIMIT 10",
             (pokemon_usage_id,),
         ) as cursor:
-            async for row in cursor:
-                teammates.append(
-                    TeammateUsage(
-                        teammate=row["teammate"],
-                        count=row["count"],
-                        percent=row["percent"],
-                    )
-                )
+            teammates = [TeammateUsage(*row) for row in await cursor.fetchall()]
 
         # Get spreads
-        spreads = []
         async with db.execute(
-            "SELECT * FROM spreads WHERE pokemon_usage_id = ? ORDER BY count DESC LIMIT 10",
+            "SELECT nature, hp, atk, def, spa, spd, spe, count, percent FROM spreads "
+            "WHERE pokemon_usage_id = ? ORDER BY count DESC LIMIT 10",
             (pokemon_usage_id,),
         ) as cursor:
-            async for row in cursor:
-                spreads.append(
-                    EVSpread(
-                        nature=row["nature"],
-                        hp=row["hp"],
-                        atk=row["atk"],
-                        def_=row["def"],
-                        spa=row["spa"],
-                        spd=row["spd"],
-                        spe=row["spe"],
-                        count=row["count"],
-                        percent=row["percent"],
-                    )
-                )
+            spreads = [EVSpread(*row) for row in await cursor.fetchall()]
 
         # Get tera types (from moveset data)
-        tera_types = []
         async with db.execute(
-            "SELECT * FROM tera_types WHERE pokemon_usage_id = ? ORDER BY percent DESC LIMIT 10",
+            "SELECT tera_type, percent FROM tera_types "
+            "WHERE pokemon_usage_id = ? ORDER BY percent DESC LIMIT 10",
             (pokemon_usage_id,),
         ) as cursor:
-            async for row in cursor:
-                tera_types.append(
-                    TeraTypeUsage(
-                        tera_type=row["tera_type"],
-                        percent=row["percent"],
-                    )
-                )
+            tera_types = [TeraTypeUsage(*row) for row in await cursor.fetchall()]
 
         # Get checks/counters (from moveset data)
-        checks_counters = []
         async with db.execute(
-            "SELECT * FROM checks_counters WHERE pokemon_usage_id = ? ORDER BY score DESC LIMIT 10",
+            "SELECT counter, score, win_percent, ko_percent, switch_percent FROM checks_counters "
+            "WHERE pokemon_usage_id = ? ORDER BY score DESC LIMIT 10",
             (pokemon_usage_id,),
         ) as cursor:
-            async for row in cursor:
-                checks_counters.append(
-                    CheckCounter(
-                        counter=row["counter"],
-                        score=row["score"],
-                        win_percent=row["win_percent"],
-                        ko_percent=row["ko_percent"],
-                        switch_percent=row["switch_percent"],
-                    )
-                )
+            checks_counters = [CheckCounter(*row) for row in await cursor.fetchall()]
 
         return PokemonStats(
             pokemon=pokemon_row["pokemon"],
@@ -13,6 +13,19 @@ from smogon_vgc_mcp.utils import fetch_text_resilient
 
 logger = logging.getLogger(__name__)
 
+# Each Pokemon block starts with a header like "| Flutter Mane |" framed by +---+ lines
+_BLOCK_HEADER_RE = re.compile(r"\+-+\+\s*\n\s*\|\s*([^|]+?)\s*\|\s*\n\s*\+-+\+")
+_TERA_SECTION_RE = re.compile(r"\|\s*Tera Types\s*\|\s*\n(.*?)(?:\+-+\+|\Z)", re.DOTALL)
+# "| Fairy 87.893% |" or "| Grass  7.504% |"
+_TERA_LINE_RE = re.compile(r"\|\s*(\w+)\s+([\d.]+)%")
+_CHECKS_SECTION_RE = re.compile(r"\|\s*Checks and Counters\s*\|\s*\n(.*?)(?:\+-+\+|\Z)", re.DOTALL)
+# "| Rillaboom 52.526 (55.22±0.67) |" or "| Tatsugiri 52.715 (59.46+-1.69) |"
+_COUNTER_LINE_RE = re.compile(
+    r"\|\s*([A-Za-z][A-Za-z0-9\-]+(?:\s*\([A-Za-z\-]+\))?)\s+([\d.]+)\s+\(([\d.]+)[±+-]+([\d.]+)\)"
+)
+# "(34.3% KOed / 25.2% switched out)"
+_KO_SWITCH_RE = re.compile(r"\(([\d.]+)%\s*KOed\s*/\s*([\d.]+)%\s*switched")
+
 
 async def fetch_moveset_text(format_code: str, month: str, elo: int) -> FetchResult[str]:
     """Fetch raw moveset text file from Smogon.
@@ -40,12 +53,8 @@ def parse_pokemon_blocks(text: str) -> list[tuple[str, str]]:
     """
     blocks = []
 
-    # Split by the separator pattern (line of +---+)
-    # Each Pokemon block starts with a header like "| Flutter Mane |"
-    pattern = r"\+-+\+\s*\n\s*\|\s*([^|]+?)\s*\|\s*\n\s*\+-+\+"
-
     # Find all Pokemon headers
-    matches = list(re.finditer(pattern, text))
+    matches = list(_BLOCK_HEADER_RE.finditer(text))
 
     for i, match in enumerate(matches):
         pokemon_name = match.group(1).strip()
@@ -75,20 +84,15 @@ def parse_tera_types(block: str) -> list[tuple[str, float]]:
     tera_types = []
 
     # Find the Tera Types section
-    tera_match = re.search(
-        r"\|\s*Tera Types\s*\|\s*\n(.*?)(?:\+-+\+|\Z)",
-        block,
-        re.DOTALL,
-    )
+    tera_match = _TERA_SECTION_RE.search(block)
 
     if not tera_match:
         return tera_types
 
     tera_section = tera_match.group(1)
 
-    # Parse lines like "| Fairy 87.893% |" or "| Grass  7.504% |"
     for line in tera_section.split("\n"):
-        match = re.search(r"\|\s*(\w+)\s+([\d.]+)%", line)
+        match = _TERA_LINE_RE.search(line)
         if match:
             tera_type = match.group(1)
             percent = float(match.group(2))
@@ -110,11 +114,7 @@ def parse_checks_counters(block: str) -> list[dict]:
     counters = []
 
     # Find the Checks and Counters section
-    cc_match = re.search(
-        r"\|\s*Checks and Counters\s*\|\s*\n(.*?)(?:\+-+\+|\Z)",
-        block,
-        re.DOTALL,
-    )
+    cc_match = _CHECKS_SECTION_RE.search(block)
 
     if not cc_match:
         return counters
@@ -126,12 +126,7 @@ def parse_checks_counters(block: str) -> list[dict]:
     while i < len(lines):
         line = lines[i]
 
-        # Match lines like "| Rillaboom 52.526 (55.22±0.67) |"
-        # or "| Tatsugiri 52.715 (59.46+-1.69) |"
-        counter_match = re.search(
-            r"\|\s*([A-Za-z][A-Za-z0-9\-]+(?:\s*\([A-Za-z\-]+\))?)\s+([\d.]+)\s+\(([\d.]+)[±+-]+([\d.]+)\)",
-            line,
-        )
+        counter_match = _COUNTER_LINE_RE.search(line)
 
         if counter_match:
             counter_name = counter_match.group(1).strip()
@@ -144,11 +139,7 @@ def parse_checks_counters(block: str) -> list[dict]:
 
             if i + 1 < len(lines):
                 next_line = lines[i + 1]
-                # Match "(34.3% KOed / 25.2% switched out)"
-                ko_switch_match = re.search(
-                    r"\(([\d.]+)%\s*KOed\s*/\s*([\d.]+)%\s*switched",
-                    next_line,
-                )
+                ko_switch_match = _KO_SWITCH_RE.search(next_line)
                 if ko_switch_match:
                     ko_percent = float(ko_switch_match.group(1))
                     switch_percent = float(ko_switch_match.group(2))
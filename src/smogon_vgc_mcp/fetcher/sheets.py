@@ -5,6 +5,7 @@ import csv
 import io
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
 
 import aiosqlite
@@ -23,6 +24,17 @@ from smogon_vgc_mcp.utils import fetch_text_resilient
 
 logger = logging.getLogger(__name__)
 
+# Sheet cells are matched in ASCII mode: IDs, codes and URLs never contain other scripts
+_POKEPASTE_URL_RE = re.compile(r"https?://pokepast\.es/[a-zA-Z0-9]+", re.ASCII)
+# Rental codes are 6-character alphanumeric codes
+_RENTAL_CODE_RE = re.compile(r"[A-Z0-9]{6}", re.ASCII)
+
+
+@lru_cache(maxsize=16)
+def _team_id_pattern(prefix: str) -> re.Pattern[str]:
+    """Compile the team ID pattern for a format's prefix (prefix followed by digits)."""
+    return re.compile(rf"{re.escape(prefix)}\d+", re.ASCII)
+
 
 async def fetch_teams_from_sheet(format_code: str) -> FetchResult[list[dict]]:
     """Fetch teams from Google Sheet for a specific format.
@@ -61,8 +73,7 @@ async def fetch_teams_from_sheet(format_code: str) -> FetchResult[list[dict]]:
     rows = list(reader)
     teams = []
 
-    # Build team ID pattern from format config
-    team_id_pattern = rf"^{fmt.team_id_prefix}\d+$"
+    team_id_pattern = _team_id_pattern(fmt.team_id_prefix)
 
     for row in rows:
         if not row or len(row) < 2:
@@ -70,7 +81,7 @@ async def fetch_teams_from_sheet(format_code: str) -> FetchResult[list[dict]]:
 
         # Check if first column is a team ID (prefix followed by digits)
         first_col = row[0].strip()
-        if not re.match(team_id_pattern, first_col):
+        if not team_id_pattern.fullmatch(first_col):
             continue
 
         team_id = first_col
@@ -80,7 +91,7 @@ async def fetch_teams_from_sheet(format_code: str) -> FetchResult[list[dict]]:
         for cell in row:
             if cell and "pokepast.es" in cell:
                 # Extract just the URL if there's extra content
-                match = re.search(r"https?://pokepast\.es/[a-zA-Z0-9]+", cell)
+                match = _POKEPASTE_URL_RE.search(cell)
                 if match:
                     pokepaste_url = match.group(0)
                 break
@@ -92,7 +103,7 @@ async def fetch_teams_from_sheet(format_code: str) -> FetchResult[list[dict]]:
         # Look for rental code - typically a 6-character alphanumeric code
         rental_code = None
         for cell in row:
-            if cell and re.match(r"^[A-Z0-9]{6}$", cell.strip()):
+            if cell and _RENTAL_CODE_RE.fullmatch(cell.strip()):
                 rental_code = cell.strip()
                 break
 
@@ -3,6 +3,7 @@
 import re
 import time
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 import httpx
 
@@ -13,7 +14,7 @@ logger = get_logger(__name__)
 STAT_ORDER = ("hp", "atk", "def_", "spa", "spd", "spe")
 
 
-@dataclass
+@dataclass(slots=True)
 class StatSpread:
     """A 6-stat spread (EVs or IVs)."""
 
@@ -28,7 +29,7 @@ class StatSpread:
         return {s: getattr(self, s) for s in STAT_ORDER}
 
 
-@dataclass
+@dataclass(slots=True)
 class Pokemon:
     """A Pokemon on a team with its set information."""
 
@@ -48,18 +49,22 @@ class Pokemon:
     @property
     def base_species(self) -> str:
         """Get base species name (without forme suffix)."""
-        if "-" in self.species and self.species not in (
-            "Ho-Oh",
-            "Porygon-Z",
-            "Jangmo-o",
-            "Hakamo-o",
-            "Kommo-o",
-        ):
-            return self.species.split("-")[0]
-        return self.species
-
-
-@dataclass
+        return _base_species(self.species)
+
+
+# Species whose hyphen is part of the name rather than a forme suffix
+_HYPHENATED_SPECIES = frozenset({"Ho-Oh", "Porygon-Z", "Jangmo-o", "Hakamo-o", "Kommo-o"})
+
+
+@lru_cache(maxsize=1024)
+def _base_species(species: str) -> str:
+    """Strip the forme suffix from a species name, e.g. 'Urshifu-Rapid-Strike'."""
+    if "-" in species and species not in _HYPHENATED_SPECIES:
+        return species.partition("-")[0]
+    return species
+
+
+@dataclass(slots=True)
 class Team:
     """A team of 6 Pokemon."""
 
@@ -79,7 +84,7 @@ class Team:
         return len(self.pokemon)
 
 
-@dataclass
+@dataclass(slots=True)
 class DamageEvent:
     """Damage dealt during a move."""
 
@@ -93,7 +98,7 @@ class DamageEvent:
         return (self.hp_remaining / self.max_hp) * 100 if self.max_hp > 0 else 0
 
 
-@dataclass
+@dataclass(slots=True)
 class MoveEvent:
     """A move used during battle."""
 
@@ -109,7 +114,7 @@ class MoveEvent:
     missed: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TeraEvent:
     """A Terastallization event."""
 
@@ -119,7 +124,7 @@ class TeraEvent:
     tera_type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class FaintEvent:
     """A Pokemon fainting."""
 
@@ -128,7 +133,7 @@ class FaintEvent:
     species: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BoostEvent:
     """A stat boost or drop."""
 
@@ -139,7 +144,7 @@ class BoostEvent:
     stages: int
 
 
-@dataclass
+@dataclass(slots=True)
 class StatusEvent:
     """A status condition applied or cured."""
 
@@ -150,7 +155,7 @@ class StatusEvent:
     cured: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class WeatherEvent:
     """Weather change."""
 
@@ -158,7 +163,7 @@ class WeatherEvent:
     weather: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldEvent:
     """Field condition change (terrain, trick room, etc.)."""
 
@@ -167,7 +172,7 @@ class FieldEvent:
     started: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class HealEvent:
     """HP restoration."""
 
@@ -182,7 +187,7 @@ class HealEvent:
 EventType = MoveEvent | TeraEvent | FaintEvent | BoostEvent | StatusEvent | WeatherEvent | FieldEvent | HealEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class Turn:
     """A single turn in the battle."""
 
@@ -210,7 +215,7 @@ class Turn:
         return [e for e in self.events if isinstance(e, StatusEvent)]
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """A player in the battle."""
 
@@ -221,7 +226,7 @@ class Player:
     brought: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class PokemonState:
     """Tracked state of an active Pokemon."""
 
@@ -233,7 +238,7 @@ class PokemonState:
     terastallized: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldState:
     """Tracked field conditions."""
 
@@ -242,7 +247,7 @@ class FieldState:
     trick_room: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class BattleState:
     """Snapshot of battle state at a point in time."""
 
@@ -251,7 +256,7 @@ class BattleState:
     turn: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Bo3Info:
     """Best-of-3 series metadata extracted from a single game."""
 
@@ -260,7 +265,7 @@ class Bo3Info:
     linked_games: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Bo3Series:
     """Aggregated best-of-3 series linking multiple parsed Replay objects."""
 
@@ -272,7 +277,7 @@ class Bo3Series:
     winner: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class Replay:
     """A complete Pokemon Showdown replay."""
 
@@ -440,13 +445,16 @@ def parse_showteam(showteam_str: str) -> list[Pokemon]:
 # HTML Extraction
 # ---------------------------------------------------------------------------
 
+_BATTLE_LOG_PATTERN = re.compile(
+    r'<script\s+type="text/plain"\s+class="battle-log-data">(.*?)</script>',
+    re.DOTALL,
+)
+_REPLAY_ID_INPUT_PATTERN = re.compile(r'name="replayid"\s+value="([^"]+)"')
+
+
 def extract_log_from_html(html: str) -> str | None:
     """Extract battle log from replay HTML page."""
-    match = re.search(
-        r'<script\s+type="text/plain"\s+class="battle-log-data">(.*?)</script>',
-        html,
-        re.DOTALL,
-    )
+    match = _BATTLE_LOG_PATTERN.search(html)
     if match:
         return match.group(1).strip()
     return None
@@ -454,7 +462,7 @@ def extract_log_from_html(html: str) -> str | None:
 
 def extract_replay_id_from_html(html: str) -> str | None:
     """Extract replay ID from HTML hidden input."""
-    match = re.search(r'name="replayid"\s+value="([^"]+)"', html)
+    match = _REPLAY_ID_INPUT_PATTERN.search(html)
     if match:
         return match.group(1)
     return None
@@ -464,20 +472,24 @@ def extract_replay_id_from_html(html: str) -> str | None:
 # URL Normalization
 # ---------------------------------------------------------------------------
 
+_POV_SUFFIX_PATTERN = re.compile(r"\?p[12]$")
+_REPLAY_URL_PATTERN = re.compile(r"replay\.pokemonshowdown\.com/([^/?#]+)")
+
+
 def normalize_replay_url(url: str) -> str:
     """Normalize a replay URL, stripping file extensions."""
     url = url.strip()
     for ext in (".html", ".json", ".log"):
         if url.endswith(ext):
             url = url[: -len(ext)]
-    url = re.sub(r"\?p[12]$", "", url)
+    url = _POV_SUFFIX_PATTERN.sub("", url)
     return url
 
 
 def extract_replay_id(url: str) -> str:
     """Extract the replay ID from a URL."""
     url = normalize_replay_url(url)
-    match = re.search(r"replay\.pokemonshowdown\.com/([^/?#]+)", url)
+    match = _REPLAY_URL_PATTERN.search(url)
     if match:
         return match.group(1)
     return url.rstrip("/").split("/")[-1]
@@ -491,6 +503,7 @@ _BO3_PATTERN = re.compile(
     r'\|uhtml\|bestof\|<h2><strong>Game\s+(\d+)</strong>\s+of\s+'
     r'<a\s+href="/game-bestof3-([^"]+)">',
 )
+_BO3_LINK_PATTERN = re.compile(r'\|tempnotify\|choice\|[^|]*\|(/[^\s|]+)')
 
 
 def _detect_bo3(log: str) -> Bo3Info | None:
@@ -503,7 +516,7 @@ def _detect_bo3(log: str) -> Bo3Info | None:
     series_id = match.group(2)
 
     linked: list[str] = []
-    for m in re.finditer(r'\|tempnotify\|choice\|[^|]*\|(/[^\s|]+)', log):
+    for m in _BO3_LINK_PATTERN.finditer(log):
         linked.append(m.group(1))
 
     return Bo3Info(game_number=game_number, series_id=series_id, linked_games=linked)
@@ -633,6 +646,47 @@ def _merge_showteam_into_team(team: Team, showteam_pokemon: list[Pokemon]) -> No
             team.pokemon.append(st_mon)
 
 
+# Protocol messages parse_replay acts on; everything else (chat, joins,
+# animations, hints, ...) is skipped before walking the dispatch chain.
+_HANDLED_COMMANDS = frozenset(
+    {
+        "player",
+        "gen",
+        "tier",
+        "rated",
+        "rule",
+        "poke",
+        "showteam",
+        "switch",
+        "drag",
+        "turn",
+        "move",
+        "-damage",
+        "-heal",
+        "-boost",
+        "-unboost",
+        "-status",
+        "-curestatus",
+        "-weather",
+        "-fieldstart",
+        "-fieldend",
+        "-supereffective",
+        "-resisted",
+        "-immune",
+        "-crit",
+        "-miss",
+        "-fail",
+        "-terastallize",
+        "faint",
+        "-item",
+        "-ability",
+        "-enditem",
+        "win",
+        "t:",
+    }
+)
+
+
 def parse_replay(log: str, replay_id: str = "") -> Replay:
     """Parse a Pokemon Showdown replay log into structured data."""
     lines = log.strip().split("\n")
@@ -661,11 +715,11 @@ def parse_replay(log: str, replay_id: str = "") -> Replay:
             continue
 
         parts = line[1:].split("|")
-        if len(parts) < 1:
-            continue
-
         cmd = parts[0]
+        if cmd not in _HANDLED_COMMANDS:
+            continue
 
+        # Every command tested below must also be listed in _HANDLED_COMMANDS
         if cmd == "player" and len(parts) >= 3:
             pid = parts[1]
             name = parts[2]
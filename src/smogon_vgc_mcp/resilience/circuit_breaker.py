@@ -1,5 +1,6 @@
 """Circuit breaker pattern implementation for external service resilience."""
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -54,14 +55,17 @@ class CircuitBreaker:
         self._failure_count = 0
         self._success_count = 0
         self._last_failure_time: datetime | None = None
+        # Monotonic twin of _last_failure_time, immune to wall-clock jumps
+        self._last_failure_mono: float | None = None
         self._lock = Lock()
 
     @property
     def state(self) -> CircuitState:
         """Get current circuit state, checking for recovery timeout."""
         with self._lock:
-            if self._state == CircuitState.OPEN and self._last_failure_time:
-                if datetime.now() - self._last_failure_time >= self.config.recovery_timeout:
+            if self._state == CircuitState.OPEN and self._last_failure_mono is not None:
+                elapsed = time.monotonic() - self._last_failure_mono
+                if elapsed >= self.config.recovery_timeout.total_seconds():
                     self._state = CircuitState.HALF_OPEN
                     self._success_count = 0
             return self._state
@@ -87,6 +91,7 @@ class CircuitBreaker:
         with self._lock:
             self._failure_count += 1
             self._last_failure_time = datetime.now()
+            self._last_failure_mono = time.monotonic()
 
             if self._state == CircuitState.HALF_OPEN:
                 self._state = CircuitState.OPEN
@@ -116,6 +121,7 @@ class CircuitBreaker:
             self._failure_count = 0
             self._success_count = 0
             self._last_failure_time = None
+            self._last_failure_mono = None
 
 
 class CircuitBreakerRegistry:
@@ -127,15 +133,24 @@ class CircuitBreakerRegistry:
     _breaker_lock: Lock
 
     def __new__(cls) -> "CircuitBreakerRegistry":
+        # Lock-free fast path once the singleton exists
+        if cls._instance is not None:
+            return cls._instance
         with cls._lock:
             if cls._instance is None:
-                cls._instance = super().__new__(cls)
-                cls._instance._breakers = {}
-                cls._instance._breaker_lock = Lock()
+                # Publish only a fully initialised instance to the fast path
+                inst = super().__new__(cls)
+                inst._breakers = {}
+                inst._breaker_lock = Lock()
+                cls._instance = inst
             return cls._instance
 
     def get_breaker(self, service: str) -> CircuitBreaker:
         """Get or create a circuit breaker for a service."""
+        # Breakers are never removed, so a hit needs no lock
+        breaker = self._breakers.get(service)
+        if breaker is not None:
+            return breaker
         with self._breaker_lock:
             if service not in self._breakers:
                 self._breakers[service] = CircuitBreaker(service)
@@ -18,7 +18,7 @@ class ErrorCategory(Enum):
     PARSE_ERROR = "parse_error"
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceError:
     """Structured error from an external service call."""
 
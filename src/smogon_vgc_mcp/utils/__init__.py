@@ -1,6 +1,8 @@
 """Shared utilities for the smogon-vgc-mcp project."""
 
 from smogon_vgc_mcp.utils.ev_iv_parser import (
+    DEFAULT_EVS,
+    DEFAULT_IVS,
     default_evs,
     default_ivs,
     parse_ev_string,
@@ -83,6 +85,8 @@ __all__ = [
     "parse_iv_string",
     "default_evs",
     "default_ivs",
+    "DEFAULT_EVS",
+    "DEFAULT_IVS",
     # HTTP client
     "fetch_json",
     "fetch_json_resilient",
@@ -11,6 +11,8 @@ Supports two formats:
 """
 
 import re
+from collections.abc import Mapping
+from types import MappingProxyType
 
 from smogon_vgc_mcp.utils.stat_names import (
     SHOWDOWN_STAT_MAP,
@@ -18,15 +20,28 @@ from smogon_vgc_mcp.utils.stat_names import (
     STAT_ORDER,
 )
 
+# Six slash-separated integers (HP/Atk/Def/SpA/SpD/Spe); signs are kept so
+# out-of-range values still reach the validators instead of being dropped.
+_COMPACT_SPREAD_RE = re.compile("/".join([r"\s*([+-]?\d+)\s*"] * 6))
+
+# One "252 HP" / "4 Def" entry of a Showdown-format spread. Entries start the
+# string (after an optional "EVs:" / "IVs:" prefix) or follow a slash.
+_SHOWDOWN_ENTRY_RE = re.compile(r"(?:^(?:EVs?:|IVs?:)?|/)\s*(\d+)\s+([^\s/]+)", re.IGNORECASE)
+
+
+# Shared read-only default spreads; copy them before handing out a mutable dict
+DEFAULT_EVS: Mapping[str, int] = MappingProxyType({stat: 0 for stat in STAT_ORDER})
+DEFAULT_IVS: Mapping[str, int] = MappingProxyType({stat: 31 for stat in STAT_ORDER})
+
 
 def default_evs() -> dict[str, int]:
     """Return default EV spread (all zeros)."""
-    return {stat: 0 for stat in STAT_ORDER}
+    return dict(DEFAULT_EVS)
 
 
 def default_ivs() -> dict[str, int]:
     """Return default IV spread (all 31s)."""
-    return {stat: 31 for stat in STAT_ORDER}
+    return dict(DEFAULT_IVS)
 
 
 def _parse_compact_spread(spread: str) -> dict[str, int] | None:
@@ -41,19 +56,11 @@ def _parse_compact_spread(spread: str) -> dict[str, int] | None:
     if "/" not in spread:
         return None
 
-    parts = spread.split("/")
-    if len(parts) != 6:
+    match = _COMPACT_SPREAD_RE.fullmatch(spread)
+    if match is None:
         return None
 
-    # Check if first part is purely numeric (compact format indicator)
-    first_part = parts[0].strip()
-    if any(c.isalpha() for c in first_part):
-        return None
-
-    try:
-        return {STAT_ORDER[i]: int(parts[i].strip()) for i in range(6)}
-    except ValueError:
-        return None
+    return dict(zip(STAT_ORDER, map(int, match.groups())))
 
 
 def _parse_showdown_spread(spread: str, default_value: int) -> dict[str, int]:
@@ -68,28 +75,11 @@ def _parse_showdown_spread(spread: str, default_value: int) -> dict[str, int]:
     """
     result = {stat: default_value for stat in STAT_ORDER}
 
-    # Handle optional "EVs:" or "IVs:" prefix
-    spread = re.sub(r"^(EVs?|IVs?):\s*", "", spread, flags=re.IGNORECASE)
-
-    for part in spread.split("/"):
-        part = part.strip()
-        if not part:
-            continue
-
-        # Match "252 HP" or "4 Def" pattern
-        match = re.match(r"(\d+)\s+(\S+)", part)
-        if match:
-            value = int(match.group(1))
-            stat_name = match.group(2)
-
-            # Try Showdown format first (case-sensitive)
-            if stat_name in SHOWDOWN_STAT_MAP:
-                result[SHOWDOWN_STAT_MAP[stat_name]] = value
-            else:
-                # Try lowercase matching for other variants
-                normalized = stat_name.lower().replace(" ", "")
-                if normalized in STAT_NAME_MAP:
-                    result[STAT_NAME_MAP[normalized]] = value
+    for value, stat_name in _SHOWDOWN_ENTRY_RE.findall(spread):
+        # Try Showdown format first (case-sensitive), then other variants
+        stat = SHOWDOWN_STAT_MAP.get(stat_name) or STAT_NAME_MAP.get(stat_name.lower())
+        if stat:
+            result[stat] = int(value)
 
     return result
 
@@ -2,7 +2,12 @@
 
 import re
 
-from smogon_vgc_mcp.data.pokemon_data import ALL_TYPES, NATURE_MODIFIERS, get_base_stats
+from smogon_vgc_mcp.data.pokemon_data import (
+    ALL_TYPES,
+    ALL_TYPES_SET,
+    NATURE_MODIFIERS,
+    get_base_stats,
+)
 from smogon_vgc_mcp.formats import FORMATS
 from smogon_vgc_mcp.utils.ev_iv_parser import parse_ev_string, parse_iv_string
 from smogon_vgc_mcp.utils.stat_names import STAT_ORDER
@@ -61,7 +66,7 @@ def validate_type_name(type_name: str) -> str:
         raise ValidationError("Type name cannot be empty")
 
     normalized = type_name.strip().capitalize()
-    if normalized not in ALL_TYPES:
+    if normalized not in ALL_TYPES_SET:
         raise ValidationError(
             f"Invalid type '{type_name}'",
             hint=f"Valid types: {', '.join(ALL_TYPES)}",
@@ -1,6 +1,10 @@
 """Pytest configuration and shared fixtures."""
 
-from unittest.mock import AsyncMock
+import asyncio
+import inspect
+import shutil
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -18,6 +22,8 @@ from smogon_vgc_mcp.database.models import (
     TeraTypeUsage,
     UsageRanking,
 )
+from smogon_vgc_mcp.database.schema import init_database
+from smogon_vgc_mcp.resilience import CircuitBreakerRegistry
 
 # =============================================================================
 # Sample Pokemon Data
@@ -210,29 +216,97 @@ def sample_team() -> Team:
     )
 
 
+# =============================================================================
+# Resilience Fixtures
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers():
+    """Reset the process-wide circuit breakers after each test.
+
+    The registry is a singleton, so a breaker tripped in one test would
+    otherwise stay open for later tests on the same xdist worker.
+    """
+    yield
+    CircuitBreakerRegistry().reset_all()
+
+
+# =============================================================================
+# Patching Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    """Replace ``module.name`` with a mock for one test and return the mock.
+
+    Coroutine functions get an AsyncMock, everything else a MagicMock.
+    """
+
+    def make(module: object, name: str) -> MagicMock:
+        original = getattr(module, name)
+        mock = AsyncMock() if inspect.iscoroutinefunction(original) else MagicMock()
+        monkeypatch.setattr(module, name, mock)
+        return mock
+
+    return make
+
+
 # =============================================================================
 # Mock Database Fixtures
 # =============================================================================
 
 
+@pytest.fixture(scope="session")
+def schema_template_db(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Database with the full schema and migrations applied, built once per session."""
+    path = tmp_path_factory.mktemp("schema") / "template.db"
+    asyncio.run(init_database(path))
+    return path
+
+
+@pytest.fixture
+def db_path(tmp_path: Path, schema_template_db: Path) -> Path:
+    """Fresh, fully initialized database file for one test.
+
+    Copies the session template instead of re-running init_database, which
+    replays the whole schema and every migration.
+    """
+    path = tmp_path / "test.db"
+    shutil.copyfile(schema_template_db, path)
+    return path
+
+
+_UNSET = object()
+
+
 @pytest.fixture
-def mock_db_connection():
-    """Create a mock aiosqlite connection."""
-    mock_conn = AsyncMock()
-    mock_cursor = AsyncMock()
-
-    # Set up cursor context manager
-    mock_cursor.__aenter__ = AsyncMock(return_value=mock_cursor)
-    mock_cursor.__aexit__ = AsyncMock(return_value=None)
-    mock_cursor.fetchone = AsyncMock(return_value=None)
-    mock_cursor.fetchall = AsyncMock(return_value=[])
-
-    # Set up connection.execute to return cursor
-    mock_conn.execute = AsyncMock(return_value=mock_cursor)
-    mock_conn.commit = AsyncMock()
-    mock_conn.row_factory = None
-
-    return mock_conn, mock_cursor
+def mock_db_factory():
+    """Build one aiosqlite connection double and re-point its cursor per call.
+
+    ``make(rows=..., one=...)`` sets what ``fetchall``/``fetchone`` return and
+    returns the connection, ready to be the ``get_connection`` return value.
+    ``fetchone`` defaults to the first row so lookups preceding a list query
+    succeed.
+    """
+    cursor = AsyncMock()
+    cursor.__aenter__.return_value = cursor
+    cursor.__aexit__.return_value = None
+
+    db = AsyncMock()
+    db.execute = MagicMock(return_value=cursor)
+    db.__aenter__.return_value = db
+    db.__aexit__.return_value = None
+
+    def make(rows: list | None = None, one: object = _UNSET) -> AsyncMock:
+        cursor.fetchall.return_value = rows or []
+        if one is _UNSET:
+            one = rows[0] if rows else None
+        cursor.fetchone.return_value = one
+        return db
+
+    return make
 
 
 # =============================================================================
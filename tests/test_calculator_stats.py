@@ -2,6 +2,8 @@
 
 from unittest.mock import patch
 
+import pytest
+
 from smogon_vgc_mcp.calculator.stats import (
     calculate_all_stats,
     calculate_hp,
@@ -10,6 +12,7 @@ from smogon_vgc_mcp.calculator.stats import (
     parse_ev_string,
     parse_iv_string,
 )
+from smogon_vgc_mcp.utils import DEFAULT_IVS
 
 
 class TestCalculateHP:
@@ -103,6 +106,16 @@ class TestParseEVString:
         result = parse_ev_string("4/0/0/252/0/252")
         assert result == {"hp": 4, "atk": 0, "def": 0, "spa": 252, "spd": 0, "spe": 252}
 
+    def test_compact_format_with_whitespace(self):
+        """Test compact format tolerates spaces around slashes."""
+        result = parse_ev_string(" 252 / 4 / 0 / 252 / 0 / 0 ")
+        assert result == {"hp": 252, "atk": 4, "def": 0, "spa": 252, "spd": 0, "spe": 0}
+
+    def test_compact_format_non_numeric_not_compact(self):
+        """Test a non-numeric slash spread is not treated as compact."""
+        result = parse_ev_string("252/4/0/252/0/x")
+        assert result == {"hp": 0, "atk": 0, "def": 0, "spa": 0, "spd": 0, "spe": 0}
+
     def test_showdown_format_basic(self):
         """Test Showdown format: '252 HP / 4 Def / 252 SpA'."""
         result = parse_ev_string("252 HP / 4 Def / 252 SpA")
@@ -127,6 +140,16 @@ class TestParseEVString:
         assert result["atk"] == 252
         assert result["spd"] == 4
 
+    def test_showdown_format_name_variants(self):
+        """Test non-Showdown stat names and a lowercase prefix are accepted."""
+        result = parse_ev_string("evs: 252 hp / 4 Speed / 252 spatk")
+        assert result == {"hp": 252, "atk": 0, "def": 0, "spa": 252, "spd": 0, "spe": 4}
+
+    def test_showdown_format_ignores_unlabeled_entries(self):
+        """Test entries without a leading value or known stat are skipped."""
+        result = parse_ev_string("252 HP / Def / 4 Foo / 252 Spe")
+        assert result == {"hp": 252, "atk": 0, "def": 0, "spa": 0, "spd": 0, "spe": 252}
+
     def test_empty_string_returns_zeros(self):
         """Test empty string returns all zeros."""
         result = parse_ev_string("")
@@ -172,6 +195,18 @@ class TestParseIVString:
         result = parse_iv_string(None)
         assert result == {"hp": 31, "atk": 31, "def": 31, "spa": 31, "spd": 31, "spe": 31}
 
+    def test_default_result_is_independent_copy(self):
+        """Test mutating a default result does not affect later calls."""
+        result = parse_iv_string(None)
+        result["atk"] = 0
+        assert parse_iv_string(None)["atk"] == 31
+        assert DEFAULT_IVS["atk"] == 31
+
+    def test_shared_default_is_read_only(self):
+        """Test the shared default IV mapping cannot be mutated."""
+        with pytest.raises(TypeError):
+            DEFAULT_IVS["atk"] = 0  # type: ignore[index]
+
 
 class TestCalculateAllStats:
     """Tests for calculate_all_stats function."""
@@ -280,17 +315,11 @@ class TestFormatStats:
         stats = {"hp": 202, "atk": 167, "def": 110, "spa": 100, "spd": 142, "spe": 80}
         result = format_stats(stats)
 
-        assert "HP: 202" in result
-        assert "Atk: 167" in result
-        assert "Def: 110" in result
-        assert "SpA: 100" in result
-        assert "SpD: 142" in result
-        assert "Spe: 80" in result
+        assert result == "HP: 202 | Atk: 167 | Def: 110 | SpA: 100 | SpD: 142 | Spe: 80"
 
     def test_format_stats_flutter_mane(self):
         """Test formatting Flutter Mane stats."""
         stats = {"hp": 131, "atk": 65, "def": 75, "spa": 187, "spd": 155, "spe": 205}
         result = format_stats(stats)
 
-        assert "HP: 131" in result
-        assert "Spe: 205" in result
+        assert result == "HP: 131 | Atk: 65 | Def: 75 | SpA: 187 | SpD: 155 | Spe: 205"
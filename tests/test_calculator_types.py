@@ -1,26 +1,57 @@
 """Tests for calculator/types.py - Type analysis."""
 
-from unittest.mock import patch
+from unittest.mock import DEFAULT, patch
+
+import pytest
 
 from smogon_vgc_mcp.calculator.types import (
+    _weakness_profile,
     analyze_team_types,
     get_offensive_coverage,
     get_pokemon_resistances,
     get_pokemon_weaknesses,
 )
+from smogon_vgc_mcp.data.pokemon_data import ALL_TYPES
+
+
+def _row(**multipliers: float) -> tuple[float, ...]:
+    """Build a multiplier row aligned with ALL_TYPES, neutral unless overridden."""
+    return tuple(multipliers.get(t, 1.0) for t in ALL_TYPES)
+
+
+@pytest.fixture(autouse=True)
+def clear_weakness_cache():
+    """Drop cached matchups so each test sees its own patched lookups."""
+    _weakness_profile.cache_clear()
+    yield
+    _weakness_profile.cache_clear()
+
+
+@pytest.fixture
+def lookups():
+    """Patch the species lookups behind get_pokemon_weaknesses in one step."""
+    with patch.multiple(
+        "smogon_vgc_mcp.calculator.types",
+        get_pokemon_types=DEFAULT,
+        get_weaknesses=DEFAULT,
+        get_resistances=DEFAULT,
+    ) as mocks:
+        yield mocks
 
 
 class TestGetPokemonWeaknesses:
     """Tests for get_pokemon_weaknesses function."""
 
-    @patch("smogon_vgc_mcp.calculator.types.get_pokemon_types")
-    @patch("smogon_vgc_mcp.calculator.types.get_weaknesses")
-    @patch("smogon_vgc_mcp.calculator.types.get_resistances")
-    def test_fire_dark_pokemon(self, mock_resist, mock_weak, mock_types):
+    def test_fire_dark_pokemon(self, lookups):
         """Test Fire/Dark type (Incineroar)."""
-        mock_types.return_value = ["Fire", "Dark"]
-        mock_weak.return_value = [("Water", 2), ("Fighting", 2), ("Ground", 2), ("Rock", 2)]
-        mock_resist.return_value = [
+        lookups["get_pokemon_types"].return_value = ["Fire", "Dark"]
+        lookups["get_weaknesses"].return_value = [
+            ("Water", 2),
+            ("Fighting", 2),
+            ("Ground", 2),
+            ("Rock", 2),
+        ]
+        lookups["get_resistances"].return_value = [
             ("Fire", 0.5),
             ("Grass", 0.5),
             ("Ice", 0.5),
@@ -39,14 +70,11 @@ class TestGetPokemonWeaknesses:
         assert "Psychic" in result["immunities"]
         assert len(result["4x_weak"]) == 0
 
-    @patch("smogon_vgc_mcp.calculator.types.get_pokemon_types")
-    @patch("smogon_vgc_mcp.calculator.types.get_weaknesses")
-    @patch("smogon_vgc_mcp.calculator.types.get_resistances")
-    def test_grass_steel_pokemon(self, mock_resist, mock_weak, mock_types):
+    def test_grass_steel_pokemon(self, lookups):
         """Test Grass/Steel type with 4x weakness (Ferrothorn)."""
-        mock_types.return_value = ["Grass", "Steel"]
-        mock_weak.return_value = [("Fire", 4), ("Fighting", 2)]
-        mock_resist.return_value = [
+        lookups["get_pokemon_types"].return_value = ["Grass", "Steel"]
+        lookups["get_weaknesses"].return_value = [("Fire", 4), ("Fighting", 2)]
+        lookups["get_resistances"].return_value = [
             ("Normal", 0.5),
             ("Water", 0.5),
             ("Electric", 0.5),
@@ -79,20 +107,40 @@ class TestGetPokemonWeaknesses:
 class TestGetPokemonResistances:
     """Tests for get_pokemon_resistances function."""
 
-    @patch("smogon_vgc_mcp.calculator.types.get_pokemon_types")
-    @patch("smogon_vgc_mcp.calculator.types.get_weaknesses")
-    @patch("smogon_vgc_mcp.calculator.types.get_resistances")
-    def test_returns_same_as_weaknesses(self, mock_resist, mock_weak, mock_types):
+    def test_returns_same_as_weaknesses(self, lookups):
         """Test that get_pokemon_resistances returns same info as get_pokemon_weaknesses."""
-        mock_types.return_value = ["Fire", "Dark"]
-        mock_weak.return_value = [("Water", 2)]
-        mock_resist.return_value = [("Psychic", 0)]
+        lookups["get_pokemon_types"].return_value = ["Fire", "Dark"]
+        lookups["get_weaknesses"].return_value = [("Water", 2)]
+        lookups["get_resistances"].return_value = [("Psychic", 0)]
 
         weak_result = get_pokemon_weaknesses("Incineroar")
         resist_result = get_pokemon_resistances("Incineroar")
 
         assert weak_result == resist_result
 
+    def test_lookups_are_cached(self, lookups):
+        """Test repeated queries reuse the cached matchups."""
+        lookups["get_pokemon_types"].return_value = ["Fire", "Dark"]
+        lookups["get_weaknesses"].return_value = [("Water", 2)]
+        lookups["get_resistances"].return_value = [("Psychic", 0)]
+
+        get_pokemon_weaknesses("Incineroar")
+        get_pokemon_resistances("Incineroar")
+
+        assert lookups["get_pokemon_types"].call_count == 1
+        assert lookups["get_weaknesses"].call_count == 1
+
+    def test_cached_result_not_shared(self, lookups):
+        """Test mutating a returned result does not leak into later calls."""
+        lookups["get_pokemon_types"].return_value = ["Fire", "Dark"]
+        lookups["get_weaknesses"].return_value = [("Water", 2)]
+        lookups["get_resistances"].return_value = [("Psychic", 0)]
+
+        first = get_pokemon_weaknesses("Incineroar")
+        first["2x_weak"].append("Rock")
+
+        assert get_pokemon_weaknesses("Incineroar")["2x_weak"] == ["Water"]
+
 
 class TestAnalyzeTeamTypes:
     """Tests for analyze_team_types function."""
@@ -103,11 +151,11 @@ class TestAnalyzeTeamTypes:
         assert "error" in result
 
     @patch("smogon_vgc_mcp.calculator.types.get_pokemon_types")
-    @patch("smogon_vgc_mcp.calculator.types.get_type_effectiveness")
+    @patch("smogon_vgc_mcp.calculator.types.get_defensive_multipliers")
     def test_single_pokemon_team(self, mock_eff, mock_types):
         """Test team with single Pokemon."""
         mock_types.return_value = ["Fire", "Dark"]
-        mock_eff.return_value = 1.0  # Neutral for simplicity
+        mock_eff.return_value = _row()  # Neutral for simplicity
 
         result = analyze_team_types(["Incineroar"])
 
@@ -116,7 +164,7 @@ class TestAnalyzeTeamTypes:
         assert result["errors"] is None
 
     @patch("smogon_vgc_mcp.calculator.types.get_pokemon_types")
-    @patch("smogon_vgc_mcp.calculator.types.get_type_effectiveness")
+    @patch("smogon_vgc_mcp.calculator.types.get_defensive_multipliers")
     def test_team_with_unknown_pokemon(self, mock_eff, mock_types):
         """Test team with unknown Pokemon."""
 
@@ -126,7 +174,7 @@ class TestAnalyzeTeamTypes:
             return None
 
         mock_types.side_effect = mock_get_types
-        mock_eff.return_value = 1.0
+        mock_eff.return_value = _row()
 
         result = analyze_team_types(["Incineroar", "NotAPokemon"])
 
@@ -135,7 +183,7 @@ class TestAnalyzeTeamTypes:
         assert "NotAPokemon" in result["errors"][0]
 
     @patch("smogon_vgc_mcp.calculator.types.get_pokemon_types")
-    @patch("smogon_vgc_mcp.calculator.types.get_type_effectiveness")
+    @patch("smogon_vgc_mcp.calculator.types.get_defensive_multipliers")
     def test_shared_weakness_detection(self, mock_eff, mock_types):
         """Test detection of shared weaknesses."""
 
@@ -146,14 +194,9 @@ class TestAnalyzeTeamTypes:
             }
             return types.get(pokemon)
 
-        def mock_effectiveness(atk_type, def_types):
-            # Water is SE against Fire
-            if atk_type == "Water" and "Fire" in def_types:
-                return 2.0
-            return 1.0
-
         mock_types.side_effect = mock_get_types
-        mock_eff.side_effect = mock_effectiveness
+        # Water is SE against Fire, which both team members share
+        mock_eff.return_value = _row(Water=2.0)
 
         result = analyze_team_types(["Incineroar", "Charizard"])
 
@@ -165,41 +208,26 @@ class TestAnalyzeTeamTypes:
 class TestGetOffensiveCoverage:
     """Tests for get_offensive_coverage function."""
 
-    @patch("smogon_vgc_mcp.calculator.types.get_type_effectiveness")
+    @patch("smogon_vgc_mcp.calculator.types.get_offensive_multipliers")
     def test_single_move_type(self, mock_eff):
         """Test coverage with single move type."""
-
-        def mock_effectiveness(atk_type, def_types):
-            if atk_type == "Fire":
-                if def_types == ["Grass"]:
-                    return 2.0
-                elif def_types == ["Water"]:
-                    return 0.5
-                elif def_types == ["Rock"]:
-                    return 0.5
-            return 1.0
-
-        mock_eff.side_effect = mock_effectiveness
+        mock_eff.return_value = _row(Grass=2.0, Water=0.5, Rock=0.5)
 
         result = get_offensive_coverage(["Fire"])
 
         assert result["move_types"] == ["Fire"]
         assert "Grass" in result["super_effective_against"]
+        mock_eff.assert_called_once_with("Fire")
 
-    @patch("smogon_vgc_mcp.calculator.types.get_type_effectiveness")
+    @patch("smogon_vgc_mcp.calculator.types.get_offensive_multipliers")
     def test_dual_stab_coverage(self, mock_eff):
         """Test coverage with dual STAB."""
-
-        def mock_effectiveness(atk_type, def_types):
+        mock_eff.side_effect = [
             # Fire hits Grass, Ice, Steel, Bug SE
-            if atk_type == "Fire" and def_types[0] in ["Grass", "Ice", "Steel", "Bug"]:
-                return 2.0
+            _row(Grass=2.0, Ice=2.0, Steel=2.0, Bug=2.0),
             # Dark hits Ghost, Psychic SE
-            if atk_type == "Dark" and def_types[0] in ["Ghost", "Psychic"]:
-                return 2.0
-            return 1.0
-
-        mock_eff.side_effect = mock_effectiveness
+            _row(Ghost=2.0, Psychic=2.0),
+        ]
 
         result = get_offensive_coverage(["Fire", "Dark"])
 
@@ -207,35 +235,26 @@ class TestGetOffensiveCoverage:
         assert "Ghost" in result["super_effective_against"]
         assert "Psychic" in result["super_effective_against"]
 
-    @patch("smogon_vgc_mcp.calculator.types.get_type_effectiveness")
+    @patch("smogon_vgc_mcp.calculator.types.get_offensive_multipliers")
     def test_coverage_gaps(self, mock_eff):
         """Test detection of coverage gaps."""
-
-        def mock_effectiveness(atk_type, def_types):
-            # Normal doesn't hit anything SE
-            return 1.0
-
-        mock_eff.side_effect = mock_effectiveness
+        # Normal doesn't hit anything SE
+        mock_eff.return_value = _row()
 
         result = get_offensive_coverage(["Normal"])
 
         # Normal doesn't hit anything SE, so no_super_effective_coverage should have all types
         assert len(result["no_super_effective_coverage"]) > 0
 
-    @patch("smogon_vgc_mcp.calculator.types.get_type_effectiveness")
+    @patch("smogon_vgc_mcp.calculator.types.get_offensive_multipliers")
     def test_immunity_detection(self, mock_eff):
         """Test detection of immune types."""
-
-        def mock_effectiveness(atk_type, def_types):
+        mock_eff.side_effect = [
             # Normal doesn't affect Ghost
-            if atk_type == "Normal" and def_types == ["Ghost"]:
-                return 0
+            _row(Ghost=0.0),
             # Ground doesn't affect Flying
-            if atk_type == "Ground" and def_types == ["Flying"]:
-                return 0
-            return 1.0
-
-        mock_eff.side_effect = mock_effectiveness
+            _row(Flying=0.0),
+        ]
 
         result = get_offensive_coverage(["Normal", "Ground"])
 
@@ -8,14 +8,7 @@ from smogon_vgc_mcp.database.champions_team_queries import (
     write_or_queue_team,
 )
 from smogon_vgc_mcp.database.models import ChampionsTeam, ChampionsTeamPokemon
-from smogon_vgc_mcp.database.schema import get_connection, init_database
-
-
-@pytest.fixture
-async def db_path(tmp_path: Path):
-    p = tmp_path / "test.db"
-    await init_database(p)
-    return p
+from smogon_vgc_mcp.database.schema import get_connection
 
 
 def _team(
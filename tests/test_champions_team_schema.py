@@ -2,13 +2,11 @@ from pathlib import Path
 
 import pytest
 
-from smogon_vgc_mcp.database.schema import get_connection, init_database
+from smogon_vgc_mcp.database.schema import get_connection
 
 
 @pytest.fixture
-async def db(tmp_path: Path):
-    db_path = tmp_path / "test.db"
-    await init_database(db_path)
+async def db(db_path: Path):
     async with get_connection(db_path) as conn:
         yield conn
 
@@ -3,13 +3,19 @@
 import json
 from unittest.mock import mock_open, patch
 
+import pytest
+
 from smogon_vgc_mcp.data.pokemon_data import (
     ALL_TYPES,
+    ALL_TYPES_SET,
     NATURE_MODIFIERS,
     TYPE_CHART,
+    _clear_lookup_caches,
     get_base_stats,
+    get_defensive_multipliers,
     get_nature_modifiers,
     get_nature_multiplier,
+    get_offensive_multipliers,
     get_pokemon_types,
     get_resistances,
     get_type_effectiveness,
@@ -18,6 +24,14 @@ from smogon_vgc_mcp.data.pokemon_data import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_lookup_caches():
+    """Drop loaded data and memoized lookups so each test sees its own patches."""
+    _clear_lookup_caches()
+    yield
+    _clear_lookup_caches()
+
+
 class TestNormalizePokemonName:
     """Tests for normalize_pokemon_name function."""
 
@@ -49,7 +63,6 @@ class TestNormalizePokemonName:
 class TestGetBaseStats:
     """Tests for get_base_stats function."""
 
-    @patch("smogon_vgc_mcp.data.pokemon_data._base_stats", None)
     @patch(
         "builtins.open",
         mock_open(
@@ -84,7 +97,6 @@ class TestGetBaseStats:
         assert result["atk"] == 115
         assert result["spe"] == 60
 
-    @patch("smogon_vgc_mcp.data.pokemon_data._base_stats", None)
     @patch(
         "builtins.open",
         mock_open(
@@ -105,26 +117,22 @@ class TestGetBaseStats:
     def test_case_insensitive(self):
         """Test case-insensitive lookup."""
         result1 = get_base_stats("Incineroar")
-        # Reset cache for second test
-        import smogon_vgc_mcp.data.pokemon_data as module
-
-        module._base_stats = {
-            "incineroar": {"hp": 95, "atk": 115, "def": 90, "spa": 80, "spd": 90, "spe": 60}
-        }
         result2 = get_base_stats("INCINEROAR")
         result3 = get_base_stats("incineroar")
 
         assert result1 == result2 == result3
 
-    @patch("smogon_vgc_mcp.data.pokemon_data._base_stats", {"incineroar": {"hp": 95}})
+    @patch("smogon_vgc_mcp.data.pokemon_data._load_base_stats", lambda: {"incineroar": {"hp": 95}})
     def test_unknown_pokemon_returns_none(self):
         """Test unknown Pokemon returns None."""
         result = get_base_stats("NotAPokemon")
         assert result is None
 
     @patch(
-        "smogon_vgc_mcp.data.pokemon_data._base_stats",
-        {"fluttermane": {"hp": 55, "atk": 55, "def": 55, "spa": 135, "spd": 135, "spe": 135}},
+        "smogon_vgc_mcp.data.pokemon_data._load_base_stats",
+        lambda: {
+            "fluttermane": {"hp": 55, "atk": 55, "def": 55, "spa": 135, "spd": 135, "spe": 135}
+        },
     )
     def test_normalized_name_lookup(self):
         """Test Pokemon with spaces are normalized."""
@@ -132,13 +140,23 @@ class TestGetBaseStats:
         assert result is not None
         assert result["spa"] == 135
 
+    @patch("smogon_vgc_mcp.data.pokemon_data._load_base_stats", lambda: {"incineroar": {"hp": 95}})
+    def test_repeated_lookup_is_cached(self):
+        """Test repeated lookups of the same name skip normalization."""
+        first = get_base_stats("Incineroar")
+        with patch("smogon_vgc_mcp.data.pokemon_data.normalize_pokemon_name") as mock_norm:
+            second = get_base_stats("Incineroar")
+
+        assert second is first
+        mock_norm.assert_not_called()
+
 
 class TestGetPokemonTypes:
     """Tests for get_pokemon_types function."""
 
     @patch(
-        "smogon_vgc_mcp.data.pokemon_data._types",
-        {
+        "smogon_vgc_mcp.data.pokemon_data._load_types",
+        lambda: {
             "incineroar": ["Fire", "Dark"],
             "fluttermane": ["Ghost", "Fairy"],
         },
@@ -150,8 +168,8 @@ class TestGetPokemonTypes:
         assert result == ["Fire", "Dark"]
 
     @patch(
-        "smogon_vgc_mcp.data.pokemon_data._types",
-        {
+        "smogon_vgc_mcp.data.pokemon_data._load_types",
+        lambda: {
             "pikachu": ["Electric"],
         },
     )
@@ -161,13 +179,15 @@ class TestGetPokemonTypes:
 
         assert result == ["Electric"]
 
-    @patch("smogon_vgc_mcp.data.pokemon_data._types", {"incineroar": ["Fire", "Dark"]})
+    @patch("smogon_vgc_mcp.data.pokemon_data._load_types", lambda: {"incineroar": ["Fire", "Dark"]})
     def test_unknown_pokemon_returns_none(self):
         """Test unknown Pokemon returns None."""
         result = get_pokemon_types("NotAPokemon")
         assert result is None
 
-    @patch("smogon_vgc_mcp.data.pokemon_data._types", {"fluttermane": ["Ghost", "Fairy"]})
+    @patch(
+        "smogon_vgc_mcp.data.pokemon_data._load_types", lambda: {"fluttermane": ["Ghost", "Fairy"]}
+    )
     def test_spaces_in_name(self):
         """Test Pokemon with spaces in name."""
         result = get_pokemon_types("Flutter Mane")
@@ -314,6 +334,12 @@ class TestTypeChart:
         """Test ALL_TYPES list matches TYPE_CHART keys."""
         assert set(ALL_TYPES) == set(TYPE_CHART.keys())
 
+    def test_all_types_immutable(self):
+        """Test ALL_TYPES is an immutable ordered tuple with a matching set."""
+        assert isinstance(ALL_TYPES, tuple)
+        assert len(ALL_TYPES) == len(set(ALL_TYPES)) == 18
+        assert ALL_TYPES_SET == frozenset(ALL_TYPES)
+
     def test_fire_effectiveness(self):
         """Test Fire type effectiveness."""
         fire = TYPE_CHART["Fire"]
@@ -390,6 +416,49 @@ class TestGetTypeEffectiveness:
         assert result1 == result2 == 2.0
 
 
+class TestGetOffensiveMultipliers:
+    """Tests for get_offensive_multipliers function."""
+
+    def test_matches_type_effectiveness(self):
+        """Test every entry agrees with get_type_effectiveness."""
+        for atk_type in ALL_TYPES:
+            result = get_offensive_multipliers(atk_type)
+            for def_type, mult in zip(ALL_TYPES, result):
+                assert mult == get_type_effectiveness(atk_type, [def_type])
+
+    def test_case_insensitive(self):
+        """Test case-insensitive type names."""
+        assert get_offensive_multipliers("fire") == get_offensive_multipliers("FIRE")
+
+    def test_unknown_type_is_neutral(self):
+        """Test an unknown attacking type is neutral to everything."""
+        assert get_offensive_multipliers("Shadow") == (1.0,) * len(ALL_TYPES)
+
+
+class TestGetDefensiveMultipliers:
+    """Tests for get_defensive_multipliers function."""
+
+    def test_aligned_with_all_types(self):
+        """Test one multiplier per attacking type."""
+        result = get_defensive_multipliers(["Fire", "Dark"])
+        assert len(result) == len(ALL_TYPES)
+
+    def test_matches_type_effectiveness(self):
+        """Test every entry agrees with get_type_effectiveness."""
+        for def_types in (["Grass", "Steel"], ["Ghost", "Fairy"], ["Flying", "Water"], ["Ice"]):
+            result = get_defensive_multipliers(def_types)
+            for atk_type, mult in zip(ALL_TYPES, result):
+                assert mult == get_type_effectiveness(atk_type, def_types)
+
+    def test_case_insensitive(self):
+        """Test case-insensitive type names."""
+        assert get_defensive_multipliers(["grass"]) == get_defensive_multipliers(["GRASS"])
+
+    def test_no_types_is_neutral(self):
+        """Test an empty type list is neutral to everything."""
+        assert get_defensive_multipliers([]) == (1.0,) * len(ALL_TYPES)
+
+
 class TestGetWeaknesses:
     """Tests for get_weaknesses function."""
 
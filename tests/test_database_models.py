@@ -1,5 +1,7 @@
 """Tests for database/models.py - Data models."""
 
+import pytest
+
 from smogon_vgc_mcp.database.models import (
     AbilityUsage,
     ChampionsDexMove,
@@ -49,52 +51,38 @@ class TestSnapshot:
         assert s1 == s2
 
 
-class TestAbilityUsage:
-    """Tests for AbilityUsage dataclass."""
-
-    def test_create_ability_usage(self):
-        """Test creating AbilityUsage."""
-        ability = AbilityUsage(ability="Intimidate", count=49000, percent=98.0)
-
-        assert ability.ability == "Intimidate"
-        assert ability.count == 49000
-        assert ability.percent == 98.0
-
-
-class TestItemUsage:
-    """Tests for ItemUsage dataclass."""
-
-    def test_create_item_usage(self):
-        """Test creating ItemUsage."""
-        item = ItemUsage(item="Safety Goggles", count=20000, percent=40.0)
-
-        assert item.item == "Safety Goggles"
-        assert item.count == 20000
-        assert item.percent == 40.0
-
-
-class TestMoveUsage:
-    """Tests for MoveUsage dataclass."""
-
-    def test_create_move_usage(self):
-        """Test creating MoveUsage."""
-        move = MoveUsage(move="Fake Out", count=48000, percent=96.0)
-
-        assert move.move == "Fake Out"
-        assert move.count == 48000
-        assert move.percent == 96.0
-
-
-class TestTeammateUsage:
-    """Tests for TeammateUsage dataclass."""
-
-    def test_create_teammate_usage(self):
-        """Test creating TeammateUsage."""
-        teammate = TeammateUsage(teammate="Flutter Mane", count=25000, percent=50.0)
+_USAGE_ROWS = [
+    (AbilityUsage, {"ability": "Intimidate", "count": 49000, "percent": 98.0}),
+    (ItemUsage, {"item": "Safety Goggles", "count": 20000, "percent": 40.0}),
+    (MoveUsage, {"move": "Fake Out", "count": 48000, "percent": 96.0}),
+    (TeammateUsage, {"teammate": "Flutter Mane", "count": 25000, "percent": 50.0}),
+    (TeraTypeUsage, {"tera_type": "Ghost", "percent": 45.0}),
+    (
+        CheckCounter,
+        {
+            "counter": "Urshifu-Rapid-Strike",
+            "score": 55.0,
+            "win_percent": 60.0,
+            "ko_percent": 35.0,
+            "switch_percent": 25.0,
+        },
+    ),
+    (
+        UsageRanking,
+        {"rank": 1, "pokemon": "Flutter Mane", "usage_percent": 50.1, "raw_count": 52000},
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("cls", "kwargs"), _USAGE_ROWS, ids=[cls.__name__ for cls, _ in _USAGE_ROWS]
+)
+def test_create_usage_row(cls, kwargs):
+    """Test creating the plain usage-row dataclasses keeps every field."""
+    row = cls(**kwargs)
 
-        assert teammate.teammate == "Flutter Mane"
-        assert teammate.count == 25000
-        assert teammate.percent == 50.0
+    for name, value in kwargs.items():
+        assert getattr(row, name) == value
 
 
 class TestEVSpread:
@@ -142,37 +130,6 @@ class TestEVSpread:
         assert special.hp + special.spa + special.spe == 508
 
 
-class TestTeraTypeUsage:
-    """Tests for TeraTypeUsage dataclass."""
-
-    def test_create_tera_type_usage(self):
-        """Test creating TeraTypeUsage."""
-        tera = TeraTypeUsage(tera_type="Ghost", percent=45.0)
-
-        assert tera.tera_type == "Ghost"
-        assert tera.percent == 45.0
-
-
-class TestCheckCounter:
-    """Tests for CheckCounter dataclass."""
-
-    def test_create_check_counter(self):
-        """Test creating CheckCounter."""
-        counter = CheckCounter(
-            counter="Urshifu-Rapid-Strike",
-            score=55.0,
-            win_percent=60.0,
-            ko_percent=35.0,
-            switch_percent=25.0,
-        )
-
-        assert counter.counter == "Urshifu-Rapid-Strike"
-        assert counter.score == 55.0
-        assert counter.win_percent == 60.0
-        assert counter.ko_percent == 35.0
-        assert counter.switch_percent == 25.0
-
-
 class TestPokemonStats:
     """Tests for PokemonStats dataclass."""
 
@@ -226,24 +183,6 @@ class TestPokemonStats:
         assert isinstance(stats.checks_counters, list)
 
 
-class TestUsageRanking:
-    """Tests for UsageRanking dataclass."""
-
-    def test_create_usage_ranking(self):
-        """Test creating UsageRanking."""
-        ranking = UsageRanking(
-            rank=1,
-            pokemon="Flutter Mane",
-            usage_percent=50.1,
-            raw_count=52000,
-        )
-
-        assert ranking.rank == 1
-        assert ranking.pokemon == "Flutter Mane"
-        assert ranking.usage_percent == 50.1
-        assert ranking.raw_count == 52000
-
-
 class TestTeamPokemon:
     """Tests for TeamPokemon dataclass."""
 
@@ -256,6 +195,14 @@ class TestTeamPokemon:
         assert pokemon.item is None
         assert pokemon.ability is None
 
+    def test_no_instance_dict(self):
+        """Test TeamPokemon uses slots and rejects unknown attributes."""
+        pokemon = TeamPokemon(slot=1, pokemon="Incineroar")
+
+        assert not hasattr(pokemon, "__dict__")
+        with pytest.raises(AttributeError):
+            pokemon.nickname = "Cat"
+
     def test_create_team_pokemon_full(self):
         """Test creating TeamPokemon with all fields."""
         pokemon = TeamPokemon(
@@ -1,12 +1,16 @@
 """Tests for database/queries.py - Database query functions."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
 from smogon_vgc_mcp.database.models import (
+    AbilityUsage,
+    CheckCounter,
+    EVSpread,
     Snapshot,
     TeammateUsage,
+    TeraTypeUsage,
 )
 from smogon_vgc_mcp.database.queries import (
     find_by_item,
@@ -14,6 +18,7 @@ from smogon_vgc_mcp.database.queries import (
     find_by_tera_type,
     get_all_snapshots,
     get_counters_for,
+    get_pokemon_stats,
     get_snapshot,
     get_team,
     get_team_count,
@@ -21,56 +26,35 @@ from smogon_vgc_mcp.database.queries import (
     get_usage_rankings,
     search_pokemon,
 )
+from smogon_vgc_mcp.database.schema import get_connection
 
+# Mocked-connection tests share a loop; classes touching real aiosqlite opt back out
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-def create_mock_row(data: dict):
-    """Create a mock row object that supports item access."""
-    row = MagicMock()
-    row.__getitem__ = lambda self, key: data[key]
-    return row
 
-
-def create_async_cursor(rows):
-    """Create a mock async cursor that yields rows."""
-    cursor = AsyncMock()
-    cursor.fetchone = AsyncMock(return_value=rows[0] if rows else None)
-    cursor.fetchall = AsyncMock(return_value=rows)
-
-    # For async iteration
-    cursor.__aiter__ = lambda self: iter(rows)
-
-    return cursor
+@pytest.fixture
+def mock_get_conn(monkeypatch):
+    """Replace get_connection in the queries module with a mock."""
+    mock = MagicMock()
+    monkeypatch.setattr("smogon_vgc_mcp.database.queries.get_connection", mock)
+    return mock
 
 
 class TestGetSnapshot:
     """Tests for get_snapshot function."""
 
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.database.queries.get_connection")
-    async def test_returns_snapshot_when_found(self, mock_get_conn):
+    async def test_returns_snapshot_when_found(self, mock_get_conn, mock_db_factory):
         """Test returning snapshot when found."""
-        mock_row = create_mock_row(
-            {
-                "id": 1,
-                "format": "regf",
-                "month": "2025-12",
-                "elo_bracket": 1500,
-                "num_battles": 100000,
-                "fetched_at": "2025-12-15T10:00:00",
-            }
-        )
-
-        mock_cursor = AsyncMock()
-        mock_cursor.fetchone = AsyncMock(return_value=mock_row)
-        mock_cursor.__aenter__ = AsyncMock(return_value=mock_cursor)
-        mock_cursor.__aexit__ = AsyncMock(return_value=None)
-
-        mock_db = AsyncMock()
-        mock_db.execute = MagicMock(return_value=mock_cursor)
-        mock_db.__aenter__ = AsyncMock(return_value=mock_db)
-        mock_db.__aexit__ = AsyncMock(return_value=None)
+        mock_row = {
+            "id": 1,
+            "format": "regf",
+            "month": "2025-12",
+            "elo_bracket": 1500,
+            "num_battles": 100000,
+            "fetched_at": "2025-12-15T10:00:00",
+        }
 
-        mock_get_conn.return_value = mock_db
+        mock_get_conn.return_value = mock_db_factory(one=mock_row)
 
         result = await get_snapshot("regf", "2025-12", 1500)
 
@@ -80,21 +64,9 @@ class TestGetSnapshot:
         assert result.month == "2025-12"
         assert result.elo_bracket == 1500
 
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.database.queries.get_connection")
-    async def test_returns_none_when_not_found(self, mock_get_conn):
+    async def test_returns_none_when_not_found(self, mock_get_conn, mock_db_factory):
         """Test returning None when snapshot not found."""
-        mock_cursor = AsyncMock()
-        mock_cursor.fetchone = AsyncMock(return_value=None)
-        mock_cursor.__aenter__ = AsyncMock(return_value=mock_cursor)
-        mock_cursor.__aexit__ = AsyncMock(return_value=None)
-
-        mock_db = AsyncMock()
-        mock_db.execute = MagicMock(return_value=mock_cursor)
-        mock_db.__aenter__ = AsyncMock(return_value=mock_db)
-        mock_db.__aexit__ = AsyncMock(return_value=None)
-
-        mock_get_conn.return_value = mock_db
+        mock_get_conn.return_value = mock_db_factory(one=None)
 
         result = await get_snapshot("regf", "2099-99", 1500)
 
@@ -104,44 +76,28 @@ class TestGetSnapshot:
 class TestGetAllSnapshots:
     """Tests for get_all_snapshots function."""
 
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.database.queries.get_connection")
-    async def test_returns_list_of_snapshots(self, mock_get_conn):
+    async def test_returns_list_of_snapshots(self, mock_get_conn, mock_db_factory):
         """Test returning list of snapshots."""
         mock_rows = [
-            create_mock_row(
-                {
-                    "id": 1,
-                    "format": "regf",
-                    "month": "2025-12",
-                    "elo_bracket": 1500,
-                    "num_battles": 100000,
-                    "fetched_at": "2025-12-15",
-                }
-            ),
-            create_mock_row(
-                {
-                    "id": 2,
-                    "format": "regf",
-                    "month": "2025-11",
-                    "elo_bracket": 1500,
-                    "num_battles": 90000,
-                    "fetched_at": "2025-11-15",
-                }
-            ),
+            {
+                "id": 1,
+                "format": "regf",
+                "month": "2025-12",
+                "elo_bracket": 1500,
+                "num_battles": 100000,
+                "fetched_at": "2025-12-15",
+            },
+            {
+                "id": 2,
+                "format": "regf",
+                "month": "2025-11",
+                "elo_bracket": 1500,
+                "num_battles": 90000,
+                "fetched_at": "2025-11-15",
+            },
         ]
 
-        mock_cursor = AsyncMock()
-        mock_cursor.fetchall = AsyncMock(return_value=mock_rows)
-        mock_cursor.__aenter__ = AsyncMock(return_value=mock_cursor)
-        mock_cursor.__aexit__ = AsyncMock(return_value=None)
-
-        mock_db = AsyncMock()
-        mock_db.execute = MagicMock(return_value=mock_cursor)
-        mock_db.__aenter__ = AsyncMock(return_value=mock_db)
-        mock_db.__aexit__ = AsyncMock(return_value=None)
-
-        mock_get_conn.return_value = mock_db
+        mock_get_conn.return_value = mock_db_factory(rows=mock_rows)
 
         result = await get_all_snapshots("regf")
 
@@ -150,45 +106,79 @@ class TestGetAllSnapshots:
         assert result[0].month == "2025-12"
         assert result[1].month == "2025-11"
 
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.database.queries.get_connection")
-    async def test_returns_empty_list_when_no_snapshots(self, mock_get_conn):
+    async def test_returns_empty_list_when_no_snapshots(self, mock_get_conn, mock_db_factory):
         """Test returning empty list when no snapshots."""
-        mock_cursor = AsyncMock()
-        mock_cursor.fetchall = AsyncMock(return_value=[])
-        mock_cursor.__aenter__ = AsyncMock(return_value=mock_cursor)
-        mock_cursor.__aexit__ = AsyncMock(return_value=None)
-
-        mock_db = AsyncMock()
-        mock_db.execute = MagicMock(return_value=mock_cursor)
-        mock_db.__aenter__ = AsyncMock(return_value=mock_db)
-        mock_db.__aexit__ = AsyncMock(return_value=None)
-
-        mock_get_conn.return_value = mock_db
+        mock_get_conn.return_value = mock_db_factory()
 
         result = await get_all_snapshots("nonexistent")
 
         assert result == []
 
 
+class TestGetPokemonStats:
+    """Tests for get_pokemon_stats against a real schema."""
+
+    # stats_db opens real connections per test, so keep these on their own loop
+    pytestmark = pytest.mark.asyncio(loop_scope="function")
+
+    @pytest.fixture
+    async def stats_db(self, db_path):
+        async with get_connection(db_path) as db:
+            await db.execute(
+                "INSERT INTO snapshots (id, format, month, elo_bracket, num_battles) "
+                "VALUES (1, 'regf', '2025-12', 1500, 1000)"
+            )
+            await db.execute(
+                "INSERT INTO pokemon_usage (id, snapshot_id, pokemon, raw_count, "
+                "viability_ceiling) VALUES (1, 1, 'Incineroar', 500, '[1, 1, 1, 1]')"
+            )
+            await db.executemany(
+                "INSERT INTO abilities (pokemon_usage_id, ability, count, percent) "
+                "VALUES (1, ?, ?, ?)",
+                [("Blaze", 10.0, 2.0), ("Intimidate", 490.0, 98.0)],
+            )
+            await db.execute(
+                "INSERT INTO spreads (pokemon_usage_id, nature, hp, atk, def, spa, spd, spe, "
+                "count, percent) VALUES (1, 'Careful', 252, 4, 0, 0, 252, 0, 150.0, 30.0)"
+            )
+            await db.execute(
+                "INSERT INTO tera_types (pokemon_usage_id, tera_type, percent) "
+                "VALUES (1, 'Ghost', 45.0)"
+            )
+            await db.execute(
+                "INSERT INTO checks_counters (pokemon_usage_id, counter, score, win_percent, "
+                "ko_percent, switch_percent) VALUES (1, 'Urshifu', 55.0, 60.0, 35.0, 25.0)"
+            )
+            await db.commit()
+        return db_path
+
+    async def test_maps_columns_onto_models(self, stats_db):
+        """Test every section maps its row columns onto the right fields."""
+        stats = await get_pokemon_stats("incineroar", db_path=stats_db)
+
+        assert stats is not None
+        assert stats.usage_percent == 25.0
+        assert stats.viability_ceiling == [1, 1, 1, 1]
+        assert stats.abilities == [
+            AbilityUsage("Intimidate", 490.0, 98.0),
+            AbilityUsage("Blaze", 10.0, 2.0),
+        ]
+        assert stats.spreads == [EVSpread("Careful", 252, 4, 0, 0, 252, 0, 150.0, 30.0)]
+        assert stats.tera_types == [TeraTypeUsage("Ghost", 45.0)]
+        assert stats.checks_counters == [CheckCounter("Urshifu", 55.0, 60.0, 35.0, 25.0)]
+        assert stats.items == []
+
+    async def test_unknown_pokemon(self, stats_db):
+        """Test returning None for a Pokemon missing from the snapshot."""
+        assert await get_pokemon_stats("Pikachu", db_path=stats_db) is None
+
+
 class TestGetUsageRankings:
     """Tests for get_usage_rankings function."""
 
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.database.queries.get_connection")
-    async def test_returns_empty_list_when_no_snapshot(self, mock_get_conn):
+    async def test_returns_empty_list_when_no_snapshot(self, mock_get_conn, mock_db_factory):
         """Test returning empty list when snapshot not found."""
-        mock_cursor = AsyncMock()
-        mock_cursor.fetchone = AsyncMock(return_value=None)
-        mock_cursor.__aenter__ = AsyncMock(return_value=mock_cursor)
-        mock_cursor.__aexit__ = AsyncMock(return_value=None)
-
-        mock_db = AsyncMock()
-        mock_db.execute = MagicMock(return_value=mock_cursor)
-        mock_db.__aenter__ = AsyncMock(return_value=mock_db)
-        mock_db.__aexit__ = AsyncMock(return_value=None)
-
-        mock_get_conn.return_value = mock_db
+        mock_get_conn.return_value = mock_db_factory(one=None)
 
         result = await get_usage_rankings("regf", "2099-99", 1500)
 
@@ -198,47 +188,23 @@ class TestGetUsageRankings:
 class TestSearchPokemon:
     """Tests for search_pokemon function."""
 
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.database.queries.get_connection")
-    async def test_search_returns_matching_pokemon(self, mock_get_conn):
+    async def test_search_returns_matching_pokemon(self, mock_get_conn, mock_db_factory):
         """Test search returns matching Pokemon names."""
         mock_rows = [
-            create_mock_row({"pokemon": "Incineroar"}),
-            create_mock_row({"pokemon": "Incandescent"}),
+            {"pokemon": "Incineroar"},
+            {"pokemon": "Incandescent"},
         ]
 
-        mock_cursor = AsyncMock()
-        mock_cursor.fetchall = AsyncMock(return_value=mock_rows)
-        mock_cursor.__aenter__ = AsyncMock(return_value=mock_cursor)
-        mock_cursor.__aexit__ = AsyncMock(return_value=None)
-
-        mock_db = AsyncMock()
-        mock_db.execute = MagicMock(return_value=mock_cursor)
-        mock_db.__aenter__ = AsyncMock(return_value=mock_db)
-        mock_db.__aexit__ = AsyncMock(return_value=None)
-
-        mock_get_conn.return_value = mock_db
+        mock_get_conn.return_value = mock_db_factory(rows=mock_rows)
 
         result = await search_pokemon("inc")
 
         assert len(result) == 2
         assert "Incineroar" in result
 
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.database.queries.get_connection")
-    async def test_search_returns_empty_list_when_no_match(self, mock_get_conn):
+    async def test_search_returns_empty_list_when_no_match(self, mock_get_conn, mock_db_factory):
         """Test search returns empty list when no match."""
-        mock_cursor = AsyncMock()
-        mock_cursor.fetchall = AsyncMock(return_value=[])
-        mock_cursor.__aenter__ = AsyncMock(return_value=mock_cursor)
-        mock_cursor.__aexit__ = AsyncMock(return_value=None)
-
-        mock_db = AsyncMock()
-        mock_db.execute = MagicMock(return_value=mock_cursor)
-        mock_db.__aenter__ = AsyncMock(return_value=mock_db)
-        mock_db.__aexit__ = AsyncMock(return_value=None)
-
-        mock_get_conn.return_value = mock_db
+        mock_get_conn.return_value = mock_db_factory()
 
         result = await search_pokemon("xyznotapokemon")
 
@@ -248,26 +214,14 @@ class TestSearchPokemon:
 class TestGetTeammates:
     """Tests for get_teammates function."""
 
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.database.queries.get_connection")
-    async def test_returns_teammates(self, mock_get_conn):
+    async def test_returns_teammates(self, mock_get_conn, mock_db_factory):
         """Test returning teammate list."""
         mock_rows = [
-            create_mock_row({"teammate": "Flutter Mane", "count": 25000, "percent": 50.0}),
-            create_mock_row({"teammate": "Raging Bolt", "count": 20000, "percent": 40.0}),
+            {"teammate": "Flutter Mane", "count": 25000, "percent": 50.0},
+            {"teammate": "Raging Bolt", "count": 20000, "percent": 40.0},
         ]
 
-        mock_cursor = AsyncMock()
-        mock_cursor.fetchall = AsyncMock(return_value=mock_rows)
-        mock_cursor.__aenter__ = AsyncMock(return_value=mock_cursor)
-        mock_cursor.__aexit__ = AsyncMock(return_value=None)
-
-        mock_db = AsyncMock()
-        mock_db.execute = MagicMock(return_value=mock_cursor)
-        mock_db.__aenter__ = AsyncMock(return_value=mock_db)
-        mock_db.__aexit__ = AsyncMock(return_value=None)
-
-        mock_get_conn.return_value = mock_db
+        mock_get_conn.return_value = mock_db_factory(rows=mock_rows)
 
         result = await get_teammates("Incineroar")
 
@@ -277,91 +231,46 @@ class TestGetTeammates:
         assert result[0].percent == 50.0
 
 
-class TestFindByItem:
-    """Tests for find_by_item function."""
+class TestFindBy:
+    """Tests for find_by_item, find_by_move and find_by_tera_type."""
 
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.database.queries.get_connection")
-    async def test_returns_pokemon_with_item(self, mock_get_conn):
-        """Test returning Pokemon that use a specific item."""
-        mock_rows = [
-            create_mock_row({"pokemon": "Incineroar", "count": 20000, "percent": 40.0}),
-            create_mock_row({"pokemon": "Amoonguss", "count": 15000, "percent": 30.0}),
-        ]
-
-        mock_cursor = AsyncMock()
-        mock_cursor.fetchall = AsyncMock(return_value=mock_rows)
-        mock_cursor.__aenter__ = AsyncMock(return_value=mock_cursor)
-        mock_cursor.__aexit__ = AsyncMock(return_value=None)
-
-        mock_db = AsyncMock()
-        mock_db.execute = MagicMock(return_value=mock_cursor)
-        mock_db.__aenter__ = AsyncMock(return_value=mock_db)
-        mock_db.__aexit__ = AsyncMock(return_value=None)
-
-        mock_get_conn.return_value = mock_db
-
-        result = await find_by_item("Safety Goggles")
-
-        assert len(result) == 2
-        assert result[0]["pokemon"] == "Incineroar"
-
-
-class TestFindByMove:
-    """Tests for find_by_move function."""
-
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.database.queries.get_connection")
-    async def test_returns_pokemon_with_move(self, mock_get_conn):
-        """Test returning Pokemon that use a specific move."""
-        mock_rows = [
-            create_mock_row({"pokemon": "Incineroar", "count": 48000, "percent": 96.0}),
-            create_mock_row({"pokemon": "Rillaboom", "count": 35000, "percent": 70.0}),
-        ]
-
-        mock_cursor = AsyncMock()
-        mock_cursor.fetchall = AsyncMock(return_value=mock_rows)
-        mock_cursor.__aenter__ = AsyncMock(return_value=mock_cursor)
-        mock_cursor.__aexit__ = AsyncMock(return_value=None)
-
-        mock_db = AsyncMock()
-        mock_db.execute = MagicMock(return_value=mock_cursor)
-        mock_db.__aenter__ = AsyncMock(return_value=mock_db)
-        mock_db.__aexit__ = AsyncMock(return_value=None)
-
-        mock_get_conn.return_value = mock_db
-
-        result = await find_by_move("Fake Out")
-
-        assert len(result) == 2
-        assert result[0]["pokemon"] == "Incineroar"
-
-
-class TestFindByTeraType:
-    """Tests for find_by_tera_type function."""
-
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.database.queries.get_connection")
-    async def test_returns_pokemon_with_tera_type(self, mock_get_conn):
-        """Test returning Pokemon that use a specific Tera type."""
-        mock_rows = [
-            create_mock_row({"pokemon": "Incineroar", "percent": 45.0}),
-            create_mock_row({"pokemon": "Flutter Mane", "percent": 20.0}),
-        ]
-
-        mock_cursor = AsyncMock()
-        mock_cursor.fetchall = AsyncMock(return_value=mock_rows)
-        mock_cursor.__aenter__ = AsyncMock(return_value=mock_cursor)
-        mock_cursor.__aexit__ = AsyncMock(return_value=None)
-
-        mock_db = AsyncMock()
-        mock_db.execute = MagicMock(return_value=mock_cursor)
-        mock_db.__aenter__ = AsyncMock(return_value=mock_db)
-        mock_db.__aexit__ = AsyncMock(return_value=None)
-
-        mock_get_conn.return_value = mock_db
+    @pytest.mark.parametrize(
+        ("find", "query", "rows"),
+        [
+            (
+                find_by_item,
+                "Safety Goggles",
+                [
+                    {"pokemon": "Incineroar", "count": 20000, "percent": 40.0},
+                    {"pokemon": "Amoonguss", "count": 15000, "percent": 30.0},
+                ],
+            ),
+            (
+                find_by_move,
+                "Fake Out",
+                [
+                    {"pokemon": "Incineroar", "count": 48000, "percent": 96.0},
+                    {"pokemon": "Rillaboom", "count": 35000, "percent": 70.0},
+                ],
+            ),
+            (
+                find_by_tera_type,
+                "Ghost",
+                [
+                    {"pokemon": "Incineroar", "percent": 45.0},
+                    {"pokemon": "Flutter Mane", "percent": 20.0},
+                ],
+            ),
+        ],
+        ids=["item", "move", "tera_type"],
+    )
+    async def test_returns_matching_pokemon(
+        self, mock_get_conn, mock_db_factory, find, query, rows
+    ):
+        """Test returning the Pokemon that use an item, move or Tera type."""
+        mock_get_conn.return_value = mock_db_factory(rows=rows)
 
-        result = await find_by_tera_type("Ghost")
+        result = await find(query)
 
         assert len(result) == 2
         assert result[0]["pokemon"] == "Incineroar"
@@ -370,35 +279,19 @@ class TestFindByTeraType:
 class TestGetCountersFor:
     """Tests for get_counters_for function."""
 
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.database.queries.get_connection")
-    async def test_returns_counters(self, mock_get_conn):
+    async def test_returns_counters(self, mock_get_conn, mock_db_factory):
         """Test returning counters for a Pokemon."""
-        from smogon_vgc_mcp.database.models import CheckCounter
-
         mock_rows = [
-            create_mock_row(
-                {
-                    "counter": "Urshifu-Rapid-Strike",
-                    "score": 55.0,
-                    "win_percent": 60.0,
-                    "ko_percent": 35.0,
-                    "switch_percent": 25.0,
-                }
-            ),
+            {
+                "counter": "Urshifu-Rapid-Strike",
+                "score": 55.0,
+                "win_percent": 60.0,
+                "ko_percent": 35.0,
+                "switch_percent": 25.0,
+            },
         ]
 
-        mock_cursor = AsyncMock()
-        mock_cursor.fetchall = AsyncMock(return_value=mock_rows)
-        mock_cursor.__aenter__ = AsyncMock(return_value=mock_cursor)
-        mock_cursor.__aexit__ = AsyncMock(return_value=None)
-
-        mock_db = AsyncMock()
-        mock_db.execute = MagicMock(return_value=mock_cursor)
-        mock_db.__aenter__ = AsyncMock(return_value=mock_db)
-        mock_db.__aexit__ = AsyncMock(return_value=None)
-
-        mock_get_conn.return_value = mock_db
+        mock_get_conn.return_value = mock_db_factory(rows=mock_rows)
 
         result = await get_counters_for("Incineroar")
 
@@ -411,21 +304,9 @@ class TestGetCountersFor:
 class TestGetTeam:
     """Tests for get_team function."""
 
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.database.queries.get_connection")
-    async def test_returns_none_when_not_found(self, mock_get_conn):
+    async def test_returns_none_when_not_found(self, mock_get_conn, mock_db_factory):
         """Test returning None when team not found."""
-        mock_cursor = AsyncMock()
-        mock_cursor.fetchone = AsyncMock(return_value=None)
-        mock_cursor.__aenter__ = AsyncMock(return_value=mock_cursor)
-        mock_cursor.__aexit__ = AsyncMock(return_value=None)
-
-        mock_db = AsyncMock()
-        mock_db.execute = MagicMock(return_value=mock_cursor)
-        mock_db.__aenter__ = AsyncMock(return_value=mock_db)
-        mock_db.__aexit__ = AsyncMock(return_value=None)
-
-        mock_get_conn.return_value = mock_db
+        mock_get_conn.return_value = mock_db_factory(one=None)
 
         result = await get_team("NOTEXIST")
 
@@ -435,21 +316,9 @@ class TestGetTeam:
 class TestGetTeamCount:
     """Tests for get_team_count function."""
 
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.database.queries.get_connection")
-    async def test_returns_zero_when_no_teams(self, mock_get_conn):
+    async def test_returns_zero_when_no_teams(self, mock_get_conn, mock_db_factory):
         """Test returning 0 when no teams found."""
-        mock_cursor = AsyncMock()
-        mock_cursor.fetchone = AsyncMock(return_value=None)
-        mock_cursor.__aenter__ = AsyncMock(return_value=mock_cursor)
-        mock_cursor.__aexit__ = AsyncMock(return_value=None)
-
-        mock_db = AsyncMock()
-        mock_db.execute = MagicMock(return_value=mock_cursor)
-        mock_db.__aenter__ = AsyncMock(return_value=mock_db)
-        mock_db.__aexit__ = AsyncMock(return_value=None)
-
-        mock_get_conn.return_value = mock_db
+        mock_get_conn.return_value = mock_db_factory(one=None)
 
         result = await get_team_count()
 
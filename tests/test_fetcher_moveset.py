@@ -1,13 +1,17 @@
 """Tests for fetcher/moveset.py - Moveset data parsing."""
 
+from smogon_vgc_mcp.fetcher.moveset import (
+    parse_checks_counters,
+    parse_pokemon_blocks,
+    parse_tera_types,
+)
+
 
 class TestParsePokemonBlocks:
     """Tests for parse_pokemon_blocks function."""
 
     def test_parses_single_pokemon(self):
         """Test parsing a single Pokemon block."""
-        from smogon_vgc_mcp.fetcher.moveset import parse_pokemon_blocks
-
         text = """
  +----------------------------------------+
  | Flutter Mane                           |
@@ -26,8 +30,6 @@ class TestParsePokemonBlocks:
 
     def test_parses_multiple_pokemon(self):
         """Test parsing multiple Pokemon blocks."""
-        from smogon_vgc_mcp.fetcher.moveset import parse_pokemon_blocks
-
         text = """
  +----------------------------------------+
  | Flutter Mane                           |
@@ -53,15 +55,11 @@ class TestParsePokemonBlocks:
 
     def test_handles_empty_text(self):
         """Test handling empty text."""
-        from smogon_vgc_mcp.fetcher.moveset import parse_pokemon_blocks
-
         blocks = parse_pokemon_blocks("")
         assert blocks == []
 
     def test_handles_text_without_pokemon(self):
         """Test handling text with no Pokemon headers."""
-        from smogon_vgc_mcp.fetcher.moveset import parse_pokemon_blocks
-
         text = "Some random text without Pokemon blocks"
         blocks = parse_pokemon_blocks(text)
         assert blocks == []
@@ -72,8 +70,6 @@ class TestParseTeraTypes:
 
     def test_parses_tera_types(self):
         """Test parsing Tera Types section."""
-        from smogon_vgc_mcp.fetcher.moveset import parse_tera_types
-
         block = """
  | Tera Types                             |
  | Fairy 87.893%                          |
@@ -91,8 +87,6 @@ class TestParseTeraTypes:
 
     def test_excludes_other_tera_type(self):
         """Test that 'Other' tera type is excluded."""
-        from smogon_vgc_mcp.fetcher.moveset import parse_tera_types
-
         block = """
  | Tera Types                             |
  | Fairy 80.000%                          |
@@ -107,8 +101,6 @@ class TestParseTeraTypes:
 
     def test_handles_no_tera_types_section(self):
         """Test handling block without Tera Types section."""
-        from smogon_vgc_mcp.fetcher.moveset import parse_tera_types
-
         block = """
  | Abilities                              |
  | Intimidate 100.0%                      |
@@ -119,8 +111,6 @@ class TestParseTeraTypes:
 
     def test_handles_empty_block(self):
         """Test handling empty block."""
-        from smogon_vgc_mcp.fetcher.moveset import parse_tera_types
-
         tera_types = parse_tera_types("")
         assert tera_types == []
 
@@ -130,8 +120,6 @@ class TestParseChecksCounters:
 
     def test_parses_checks_counters(self):
         """Test parsing Checks and Counters section."""
-        from smogon_vgc_mcp.fetcher.moveset import parse_checks_counters
-
         block = """
  | Checks and Counters                    |
  | Rillaboom 52.526 (55.22±0.67)          |
@@ -154,8 +142,6 @@ class TestParseChecksCounters:
 
     def test_handles_pokemon_forms(self):
         """Test handling Pokemon with forms in names."""
-        from smogon_vgc_mcp.fetcher.moveset import parse_checks_counters
-
         block = """
  | Checks and Counters                    |
  | Urshifu-Rapid-Strike 55.000 (60.00±1.00) |
@@ -170,8 +156,6 @@ class TestParseChecksCounters:
 
     def test_handles_no_checks_counters_section(self):
         """Test handling block without Checks and Counters section."""
-        from smogon_vgc_mcp.fetcher.moveset import parse_checks_counters
-
         block = """
  | Abilities                              |
  | Intimidate 100.0%                      |
@@ -182,15 +166,11 @@ class TestParseChecksCounters:
 
     def test_handles_empty_block(self):
         """Test handling empty block."""
-        from smogon_vgc_mcp.fetcher.moveset import parse_checks_counters
-
         counters = parse_checks_counters("")
         assert counters == []
 
     def test_handles_missing_ko_switch_line(self):
         """Test handling when KO/switch line is missing."""
-        from smogon_vgc_mcp.fetcher.moveset import parse_checks_counters
-
         block = """
  | Checks and Counters                    |
  | Rillaboom 52.526 (55.22±0.67)          |
@@ -210,12 +190,6 @@ class TestMovesetIntegration:
 
     def test_full_pokemon_block_parsing(self):
         """Test parsing a complete Pokemon block."""
-        from smogon_vgc_mcp.fetcher.moveset import (
-            parse_checks_counters,
-            parse_pokemon_blocks,
-            parse_tera_types,
-        )
-
         text = """
  +----------------------------------------+
  | Incineroar                             |
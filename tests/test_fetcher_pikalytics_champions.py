@@ -1,5 +1,6 @@
 """Tests for Pikalytics Champions usage parser."""
 
+import logging
 from pathlib import Path
 
 import aiosqlite
@@ -7,12 +8,13 @@ import pytest
 
 from smogon_vgc_mcp.database.schema import SCHEMA
 from smogon_vgc_mcp.fetcher.pikalytics_champions import (
+    _FAQ_ENTRY_RE,
     _strip_faq_preamble,
     fetch_and_store_pikalytics_champions,
     parse_pikalytics_page,
     store_champions_usage,
 )
-from smogon_vgc_mcp.resilience.errors import FetchResult, ServiceError
+from smogon_vgc_mcp.resilience.errors import ErrorCategory, FetchResult, ServiceError
 
 FIXTURE = Path(__file__).parent / "fixtures" / "pikalytics_incineroar.html"
 
@@ -250,7 +252,6 @@ async def test_fetch_and_store_orchestrator_preserves_data_when_all_fetches_fail
 ) -> None:
     """When every per-slug fetch fails, the orchestrator must NOT enter
     store_champions_usage — the existing snapshot must survive intact."""
-    from smogon_vgc_mcp.resilience.errors import ErrorCategory
 
     db_path = tmp_path / "preserve.db"
 
@@ -314,7 +315,6 @@ async def test_fetch_and_store_orchestrator_records_fetch_errors(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     """Failed fetches are recorded in errors[] without aborting the run."""
-    from smogon_vgc_mcp.resilience.errors import ErrorCategory
 
     db_path = tmp_path / "orchestrator_fail.db"
 
@@ -355,8 +355,6 @@ async def test_fetch_and_store_orchestrator_records_fetch_errors(
 
 def test_parse_empty_html_returns_none_with_log(caplog: pytest.LogCaptureFixture) -> None:
     """Short/empty HTML must log a warning and return None (not silently drop)."""
-    import logging
-
     with caplog.at_level(logging.WARNING, logger="smogon_vgc_mcp.fetcher.pikalytics_champions"):
         result = parse_pikalytics_page("", pokemon_slug="incineroar")
     assert result is None
@@ -367,8 +365,6 @@ def test_parse_no_faq_block_logs_and_returns_none(
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """A long body with no FAQPage JSON-LD block must log schema-drift warning."""
-    import logging
-
     # No <script type="application/ld+json"> at all.
     html = "<html><body>" + ("<p>lorem ipsum</p>" * 50) + "</body></html>"
     with caplog.at_level(logging.WARNING, logger="smogon_vgc_mcp.fetcher.pikalytics_champions"):
@@ -384,8 +380,6 @@ def test_parse_malformed_json_ld_logs_and_returns_none(
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Corrupt JSON-LD block must be logged and not silently yield empty sections."""
-    import logging
-
     html = (
         "<html><body>"
         + ("<p>filler</p>" * 30)
@@ -438,11 +432,7 @@ def test_strip_preamble_does_not_truncate_entries_with_terminator_words() -> Non
     )
     stripped = _strip_faq_preamble(answer)
     # Parse with the real entry regex to verify all three entries survive.
-    import re as _re
-
-    from smogon_vgc_mcp.fetcher.pikalytics_champions import _FAQ_ENTRY_RE
-
-    matches = list(_re.finditer(_FAQ_ENTRY_RE, stripped))
+    matches = list(_FAQ_ENTRY_RE.finditer(stripped))
     assert len(matches) == 3, (
         f"Expected 3 entries to survive preamble stripping, got {len(matches)}: "
         f"{[m.group(1).strip() for m in matches]}"
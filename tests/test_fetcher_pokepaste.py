@@ -1,6 +1,6 @@
 """Tests for fetcher/pokepaste.py - Pokepaste parsing."""
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -8,6 +8,7 @@ from smogon_vgc_mcp.fetcher.pokepaste import (
     fetch_pokepaste,
     parse_pokepaste,
 )
+from smogon_vgc_mcp.resilience import ErrorCategory, FetchResult, ServiceError
 from smogon_vgc_mcp.utils import (
     SHOWDOWN_STAT_MAP,
     parse_ev_string,
@@ -37,110 +38,74 @@ class TestStatMap:
         assert SHOWDOWN_STAT_MAP["Spe"] == "spe"
 
 
-class TestParseEVs:
-    """Tests for parse_ev_string function."""
-
-    def test_standard_ev_line(self):
-        """Test standard EVs line parsing."""
-        result = parse_ev_string("EVs: 252 HP / 4 Def / 252 SpA")
-
-        assert result["hp"] == 252
-        assert result["def"] == 4
-        assert result["spa"] == 252
-        assert result["atk"] == 0
-        assert result["spd"] == 0
-        assert result["spe"] == 0
-
-    def test_physical_attacker_spread(self):
-        """Test physical attacker spread."""
-        result = parse_ev_string("EVs: 252 HP / 252 Atk / 4 SpD")
-
-        assert result["hp"] == 252
-        assert result["atk"] == 252
-        assert result["spd"] == 4
-
-    def test_speed_attacker_spread(self):
-        """Test speed attacker spread."""
-        result = parse_ev_string("EVs: 4 HP / 252 SpA / 252 Spe")
+def _spread(hp: int, atk: int, def_: int, spa: int, spd: int, spe: int) -> dict[str, int]:
+    return {"hp": hp, "atk": atk, "def": def_, "spa": spa, "spd": spd, "spe": spe}
 
-        assert result["hp"] == 4
-        assert result["spa"] == 252
-        assert result["spe"] == 252
 
-    def test_bulky_spread(self):
-        """Test bulky spread (Incineroar style)."""
-        result = parse_ev_string("EVs: 252 HP / 4 Atk / 252 SpD")
+def _numbered_team(n: int) -> str:
+    """Build a paste of n placeholder Pokemon numbered from 1."""
+    return "\n\n".join(
+        f"Pokemon{i} @ Item{i}\nAbility: Ability{i}\n- Move{i}" for i in range(1, n + 1)
+    )
 
-        assert result["hp"] == 252
-        assert result["atk"] == 4
-        assert result["spd"] == 252
 
-    def test_no_evs_prefix(self):
-        """Test parsing without EVs: prefix."""
-        result = parse_ev_string("252 HP / 252 Spe")
-
-        assert result["hp"] == 252
-        assert result["spe"] == 252
-
-    def test_extra_whitespace(self):
-        """Test handling of extra whitespace."""
-        result = parse_ev_string("EVs:   252 HP  /  4 Def  /  252 Spe  ")
-
-        assert result["hp"] == 252
-        assert result["def"] == 4
-        assert result["spe"] == 252
-
-    def test_empty_string_returns_zeros(self):
-        """Test empty string returns all zeros."""
-        result = parse_ev_string("")
+class TestParseEVs:
+    """Tests for parse_ev_string function."""
 
-        assert result == {"hp": 0, "atk": 0, "def": 0, "spa": 0, "spd": 0, "spe": 0}
+    @pytest.mark.parametrize(
+        ("line", "expected"),
+        [
+            pytest.param(
+                "EVs: 252 HP / 4 Def / 252 SpA",
+                _spread(252, 0, 4, 252, 0, 0),
+                id="standard_ev_line",
+            ),
+            pytest.param(
+                "EVs: 252 HP / 252 Atk / 4 SpD",
+                _spread(252, 252, 0, 0, 4, 0),
+                id="physical_attacker",
+            ),
+            pytest.param(
+                "EVs: 4 HP / 252 SpA / 252 Spe",
+                _spread(4, 0, 0, 252, 0, 252),
+                id="speed_attacker",
+            ),
+            pytest.param(
+                "EVs: 252 HP / 4 Atk / 252 SpD",
+                _spread(252, 4, 0, 0, 252, 0),
+                id="bulky",
+            ),
+            pytest.param("252 HP / 252 Spe", _spread(252, 0, 0, 0, 0, 252), id="no_evs_prefix"),
+            pytest.param(
+                "EVs:   252 HP  /  4 Def  /  252 Spe  ",
+                _spread(252, 0, 4, 0, 0, 252),
+                id="extra_whitespace",
+            ),
+            pytest.param("", _spread(0, 0, 0, 0, 0, 0), id="empty_string_returns_zeros"),
+        ],
+    )
+    def test_parse_ev_string(self, line, expected):
+        """Test EV lines parse to the full six-stat spread."""
+        assert parse_ev_string(line) == expected
 
 
 class TestParseIVs:
     """Tests for parse_iv_string function."""
 
-    def test_zero_attack_iv(self):
-        """Test parsing 0 Atk IV (common for special attackers)."""
-        result = parse_iv_string("IVs: 0 Atk")
-
-        assert result["atk"] == 0
-        assert result["hp"] == 31  # Default
-        assert result["spe"] == 31  # Default
-
-    def test_trick_room_ivs(self):
-        """Test Trick Room IVs (0 Spe)."""
-        result = parse_iv_string("IVs: 0 Spe")
-
-        assert result["spe"] == 0
-        assert result["hp"] == 31
-        assert result["atk"] == 31
-
-    def test_multiple_reduced_ivs(self):
-        """Test multiple reduced IVs."""
-        result = parse_iv_string("IVs: 0 Atk / 0 Spe")
-
-        assert result["atk"] == 0
-        assert result["spe"] == 0
-        assert result["hp"] == 31
-
-    def test_no_ivs_line_returns_max(self):
-        """Test that no IVs line returns all 31s."""
-        result = parse_iv_string("")
-
-        assert result == {"hp": 31, "atk": 31, "def": 31, "spa": 31, "spd": 31, "spe": 31}
-
-    def test_partial_iv_specification(self):
-        """Test partial IV specification (only 0 Atk)."""
-        result = parse_iv_string("IVs: 0 Atk")
-
-        # Only Atk should be 0, rest default to 31
-        assert result["atk"] == 0
-        assert result["hp"] == 31
-        assert result["def"] == 31
-        assert result["spa"] == 31
-        assert result["spd"] == 31
-        assert result["spe"] == 31
+    @pytest.mark.parametrize(
+        ("line", "expected"),
+        [
+            pytest.param("IVs: 0 Atk", _spread(31, 0, 31, 31, 31, 31), id="zero_attack"),
+            pytest.param("IVs: 0 Spe", _spread(31, 31, 31, 31, 31, 0), id="trick_room"),
+            pytest.param(
+                "IVs: 0 Atk / 0 Spe", _spread(31, 0, 31, 31, 31, 0), id="multiple_reduced"
+            ),
+            pytest.param("", _spread(31, 31, 31, 31, 31, 31), id="no_ivs_line_returns_max"),
+        ],
+    )
+    def test_parse_iv_string(self, line, expected):
+        """Test IV lines parse to the full six-stat spread, defaulting to 31."""
+        assert parse_iv_string(line) == expected
 
 
 class TestParsePokepaste:
@@ -312,39 +277,18 @@ Careful Nature
 
         assert result == []
 
-    def test_full_team_six_pokemon(self):
-        """Test parsing full team of 6 Pokemon."""
-        text = """Pokemon1 @ Item1
-Ability: Ability1
-- Move1
+    @pytest.mark.parametrize("n", [1, 3, 6])
+    def test_full_team(self, n):
+        """Test parsing teams of up to 6 Pokemon."""
+        result = parse_pokepaste(_numbered_team(n))
 
-Pokemon2 @ Item2
-Ability: Ability2
-- Move2
-
-Pokemon3 @ Item3
-Ability: Ability3
-- Move3
-
-Pokemon4 @ Item4
-Ability: Ability4
-- Move4
-
-Pokemon5 @ Item5
-Ability: Ability5
-- Move5
-
-Pokemon6 @ Item6
-Ability: Ability6
-- Move6"""
-
-        result = parse_pokepaste(text)
-
-        assert len(result) == 6
+        assert len(result) == n
         for i, pokemon in enumerate(result, start=1):
             assert pokemon.slot == i
             assert pokemon.pokemon == f"Pokemon{i}"
             assert pokemon.item == f"Item{i}"
+            assert pokemon.ability == f"Ability{i}"
+            assert pokemon.move1 == f"Move{i}"
 
     def test_slot_assignment(self):
         """Test that slots are assigned correctly."""
@@ -364,15 +308,20 @@ Pokemon3 @ Item3
         assert result[2].slot == 3
 
 
+@pytest.fixture
+def mock_fetch_text(monkeypatch):
+    """Patch the resilient fetcher used by fetch_pokepaste."""
+    mock = AsyncMock(return_value=FetchResult.ok("content"))
+    monkeypatch.setattr("smogon_vgc_mcp.fetcher.pokepaste.fetch_text_resilient", mock)
+    return mock
+
+
 class TestFetchPokepaste:
     """Tests for fetch_pokepaste async function."""
 
     @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.fetcher.pokepaste.fetch_text_resilient")
     async def test_fetch_success(self, mock_fetch_text):
         """Test successful pokepaste fetch."""
-        from smogon_vgc_mcp.resilience import FetchResult
-
         mock_fetch_text.return_value = FetchResult.ok("Pokemon @ Item\n- Move")
 
         result = await fetch_pokepaste("https://pokepast.es/abc123")
@@ -381,51 +330,23 @@ class TestFetchPokepaste:
         assert result.data == "Pokemon @ Item\n- Move"
 
     @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.fetcher.pokepaste.fetch_text_resilient")
-    async def test_fetch_adds_raw_suffix(self, mock_fetch_text):
-        """Test that /raw is appended to URL."""
-        from smogon_vgc_mcp.resilience import FetchResult
-
-        mock_fetch_text.return_value = FetchResult.ok("content")
-
-        await fetch_pokepaste("https://pokepast.es/abc123")
-
-        # Verify /raw was appended
-        call_args = mock_fetch_text.call_args
-        assert call_args[0][0] == "https://pokepast.es/abc123/raw"
-
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.fetcher.pokepaste.fetch_text_resilient")
-    async def test_fetch_handles_trailing_slash(self, mock_fetch_text):
-        """Test URL handling with trailing slash."""
-        from smogon_vgc_mcp.resilience import FetchResult
-
-        mock_fetch_text.return_value = FetchResult.ok("content")
-
-        await fetch_pokepaste("https://pokepast.es/abc123/")
-
-        call_args = mock_fetch_text.call_args
-        assert call_args[0][0] == "https://pokepast.es/abc123/raw"
+    @pytest.mark.parametrize(
+        "url",
+        [
+            pytest.param("https://pokepast.es/abc123", id="adds_raw_suffix"),
+            pytest.param("https://pokepast.es/abc123/", id="trailing_slash"),
+            pytest.param("https://pokepast.es/abc123/raw", id="already_has_raw"),
+        ],
+    )
+    async def test_fetches_raw_url(self, mock_fetch_text, url):
+        """Test the paste is always fetched from its /raw URL."""
+        await fetch_pokepaste(url)
+
+        assert mock_fetch_text.call_args.args[0] == "https://pokepast.es/abc123/raw"
 
     @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.fetcher.pokepaste.fetch_text_resilient")
-    async def test_fetch_already_has_raw(self, mock_fetch_text):
-        """Test URL that already ends with /raw."""
-        from smogon_vgc_mcp.resilience import FetchResult
-
-        mock_fetch_text.return_value = FetchResult.ok("content")
-
-        await fetch_pokepaste("https://pokepast.es/abc123/raw")
-
-        call_args = mock_fetch_text.call_args
-        assert call_args[0][0] == "https://pokepast.es/abc123/raw"
-
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.fetcher.pokepaste.fetch_text_resilient")
     async def test_fetch_http_error(self, mock_fetch_text):
         """Test handling of HTTP error (returns FetchResult with error)."""
-        from smogon_vgc_mcp.resilience import ErrorCategory, FetchResult, ServiceError
-
         mock_fetch_text.return_value = FetchResult.fail(
             ServiceError(
                 category=ErrorCategory.NETWORK,
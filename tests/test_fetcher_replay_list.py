@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from unittest.mock import AsyncMock, patch
 
 import httpx
@@ -147,8 +148,6 @@ class TestCheckActionError:
 
 def _make_response(data, status_code=200):
     """Build a mock httpx.Response."""
-    import json
-
     return httpx.Response(
         status_code=status_code,
         content=json.dumps(data).encode(),
@@ -283,8 +282,6 @@ class TestFetchPublicReplayList:
 class TestFetchPrivateReplayList:
     @pytest.mark.asyncio
     async def test_valid_cookie(self):
-        import json
-
         replays = [
             {"id": f"private-{i}", "format": "gen9vgc2026regf", "p1": "Me", "p2": "Them", "uploadtime": 100 - i, "private": True}
             for i in range(5)
@@ -303,8 +300,6 @@ class TestFetchPrivateReplayList:
 
     @pytest.mark.asyncio
     async def test_invalid_cookie_actionerror(self):
-        import json
-
         raw_text = "]" + json.dumps({"actionerror": "not logged in"})
         mock_client = AsyncMock()
         mock_client.get = AsyncMock(return_value=_make_text_response(raw_text))
@@ -319,8 +314,6 @@ class TestFetchPrivateReplayList:
 
     @pytest.mark.asyncio
     async def test_prefix_stripping(self):
-        import json
-
         replays = [{"id": "x", "format": "f", "p1": "a", "p2": "b", "uploadtime": 1}]
         raw_text = "]" + json.dumps(replays)
         mock_client = AsyncMock()
@@ -335,8 +328,6 @@ class TestFetchPrivateReplayList:
 
     @pytest.mark.asyncio
     async def test_cookie_header_sent(self):
-        import json
-
         raw_text = "]" + json.dumps([])
         mock_client = AsyncMock()
         mock_client.get = AsyncMock(return_value=_make_text_response(raw_text))
@@ -1,41 +1,55 @@
 """Tests for fetcher/sheets.py - Google Sheets team data."""
 
 import re
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 
+from smogon_vgc_mcp.database.models import TeamPokemon
+from smogon_vgc_mcp.fetcher.sheets import (
+    _POKEPASTE_URL_RE,
+    _RENTAL_CODE_RE,
+    _team_id_pattern,
+    store_team,
+    store_team_pokemon,
+)
+
 
 class TestTeamIdPattern:
     """Tests for team ID pattern matching."""
 
     def test_matches_valid_reg_f_team_ids(self):
         """Test matching valid Regulation F team IDs."""
-        pattern = r"^F\d+$"
+        pattern = _team_id_pattern("F")
 
         valid_ids = ["F1", "F123", "F999", "F10"]
         for team_id in valid_ids:
-            assert re.match(pattern, team_id), f"{team_id} should match"
+            assert pattern.fullmatch(team_id), f"{team_id} should match"
 
     def test_rejects_invalid_team_ids(self):
         """Test rejecting invalid team IDs."""
-        pattern = r"^F\d+$"
+        pattern = _team_id_pattern("F")
 
-        invalid_ids = ["", "123", "F", "FF1", "F1a", "f123", " F1"]
+        invalid_ids = ["", "123", "F", "FF1", "F1a", "f123", " F1", "F\u0661\u0662", "F12\n"]
         for team_id in invalid_ids:
-            assert not re.match(pattern, team_id), f"{team_id} should not match"
+            assert not pattern.fullmatch(team_id), f"{team_id} should not match"
 
     def test_different_format_prefixes(self):
         """Test different format prefixes."""
         # Each format has a different prefix
         patterns = {
-            "regf": r"^F\d+$",
-            "regg": r"^G\d+$",
+            "regf": _team_id_pattern("F"),
+            "regg": _team_id_pattern("G"),
         }
 
-        assert re.match(patterns["regf"], "F123")
-        assert not re.match(patterns["regf"], "G123")
-        assert re.match(patterns["regg"], "G456")
+        assert patterns["regf"].fullmatch("F123")
+        assert not patterns["regf"].fullmatch("G123")
+        assert patterns["regg"].fullmatch("G456")
+
+    def test_patterns_are_ascii(self):
+        """Test sheet patterns are compiled in ASCII mode."""
+        for pattern in (_team_id_pattern("F"), _POKEPASTE_URL_RE, _RENTAL_CODE_RE):
+            assert pattern.flags & re.ASCII
 
 
 class TestPokepasteUrlExtraction:
@@ -44,7 +58,7 @@ class TestPokepasteUrlExtraction:
     def test_extracts_pokepaste_url(self):
         """Test extracting pokepaste URL from cell."""
         cell = "https://pokepast.es/abc123def"
-        match = re.search(r"https?://pokepast\.es/[a-zA-Z0-9]+", cell)
+        match = _POKEPASTE_URL_RE.search(cell)
 
         assert match is not None
         assert match.group(0) == "https://pokepast.es/abc123def"
@@ -52,7 +66,7 @@ class TestPokepasteUrlExtraction:
     def test_extracts_url_with_extra_content(self):
         """Test extracting URL when cell has extra content."""
         cell = "Team paste: https://pokepast.es/xyz789 (shared)"
-        match = re.search(r"https?://pokepast\.es/[a-zA-Z0-9]+", cell)
+        match = _POKEPASTE_URL_RE.search(cell)
 
         assert match is not None
         assert match.group(0) == "https://pokepast.es/xyz789"
@@ -60,7 +74,7 @@ class TestPokepasteUrlExtraction:
     def test_handles_http_url(self):
         """Test handling HTTP URLs (should still match)."""
         cell = "http://pokepast.es/abc123"
-        match = re.search(r"https?://pokepast\.es/[a-zA-Z0-9]+", cell)
+        match = _POKEPASTE_URL_RE.search(cell)
 
         assert match is not None
 
@@ -73,7 +87,7 @@ class TestPokepasteUrlExtraction:
         ]
 
         for cell in invalid_cells:
-            match = re.search(r"https?://pokepast\.es/[a-zA-Z0-9]+", cell)
+            match = _POKEPASTE_URL_RE.search(cell)
             assert match is None, f"Should not match: {cell}"
 
 
@@ -85,7 +99,7 @@ class TestRentalCodeExtraction:
         valid_codes = ["ABC123", "XYZ789", "000000", "AAAAAA"]
 
         for code in valid_codes:
-            assert re.match(r"^[A-Z0-9]{6}$", code), f"{code} should match"
+            assert _RENTAL_CODE_RE.fullmatch(code), f"{code} should match"
 
     def test_rejects_invalid_rental_codes(self):
         """Test rejecting invalid rental codes."""
@@ -98,7 +112,7 @@ class TestRentalCodeExtraction:
         ]
 
         for code in invalid_codes:
-            assert not re.match(r"^[A-Z0-9]{6}$", code.strip()), f"{code} should not match"
+            assert not _RENTAL_CODE_RE.fullmatch(code.strip()), f"{code} should not match"
 
 
 class TestCSVParsing:
@@ -142,8 +156,6 @@ class TestStoreTeam:
     @pytest.mark.asyncio
     async def test_store_team_returns_none_for_missing_id(self):
         """Test that store_team returns None when team_id is missing."""
-        from smogon_vgc_mcp.fetcher.sheets import store_team
-
         mock_db = AsyncMock()
 
         team = {"description": "Test", "owner": "Player"}  # No team_id
@@ -161,50 +173,42 @@ class TestStoreTeamPokemon:
     @pytest.mark.asyncio
     async def test_store_team_pokemon_clears_existing(self):
         """Test that store_team_pokemon clears existing Pokemon first."""
-        from smogon_vgc_mcp.fetcher.sheets import store_team_pokemon
-
         mock_db = AsyncMock()
 
-        # Create mock Pokemon
-        mock_pokemon = MagicMock()
-        mock_pokemon.slot = 1
-        mock_pokemon.pokemon = "Incineroar"
-        mock_pokemon.item = "Safety Goggles"
-        mock_pokemon.ability = "Intimidate"
-        mock_pokemon.tera_type = "Ghost"
-        mock_pokemon.nature = "Careful"
-        mock_pokemon.hp_ev = 252
-        mock_pokemon.atk_ev = 4
-        mock_pokemon.def_ev = 0
-        mock_pokemon.spa_ev = 0
-        mock_pokemon.spd_ev = 252
-        mock_pokemon.spe_ev = 0
-        mock_pokemon.hp_iv = 31
-        mock_pokemon.atk_iv = 31
-        mock_pokemon.def_iv = 31
-        mock_pokemon.spa_iv = 31
-        mock_pokemon.spd_iv = 31
-        mock_pokemon.spe_iv = 31
-        mock_pokemon.move1 = "Fake Out"
-        mock_pokemon.move2 = "Knock Off"
-        mock_pokemon.move3 = "Flare Blitz"
-        mock_pokemon.move4 = "Parting Shot"
-
-        await store_team_pokemon(mock_db, 42, [mock_pokemon])
+        pokemon = TeamPokemon(
+            slot=1,
+            pokemon="Incineroar",
+            item="Safety Goggles",
+            ability="Intimidate",
+            tera_type="Ghost",
+            nature="Careful",
+            hp_ev=252,
+            atk_ev=4,
+            spd_ev=252,
+            move1="Fake Out",
+            move2="Knock Off",
+            move3="Flare Blitz",
+            move4="Parting Shot",
+        )
+
+        await store_team_pokemon(mock_db, 42, [pokemon])
 
         # Verify DELETE was called first
         calls = mock_db.execute.call_args_list
         assert len(calls) >= 2
 
         # First call should be DELETE
-        first_call = calls[0]
-        assert "DELETE" in str(first_call)
+        sql = calls[0].args[0]
+        assert sql.lstrip().upper().startswith("DELETE")
+
+        # Second call inserts the Pokemon's fields in column order
+        params = calls[1].args[1]
+        assert params[:3] == (42, 1, "Incineroar")
+        assert params[-4:] == ("Fake Out", "Knock Off", "Flare Blitz", "Parting Shot")
 
     @pytest.mark.asyncio
     async def test_store_team_pokemon_handles_empty_list(self):
         """Test that store_team_pokemon handles empty Pokemon list."""
-        from smogon_vgc_mcp.fetcher.sheets import store_team_pokemon
-
         mock_db = AsyncMock()
 
         await store_team_pokemon(mock_db, 42, [])
@@ -1,109 +1,55 @@
 """Tests for fetcher/smogon.py - Smogon stats parsing."""
 
+import pytest
 
-class TestParseSpread:
-    """Tests for parse_spread function."""
-
-    def test_parses_valid_spread(self):
-        """Test parsing a valid spread string."""
-        from smogon_vgc_mcp.fetcher.smogon import parse_spread
-
-        result = parse_spread("Careful:252/4/140/0/76/36")
-
-        assert result is not None
-        assert result["nature"] == "Careful"
-        assert result["hp"] == 252
-        assert result["atk"] == 4
-        assert result["def"] == 140
-        assert result["spa"] == 0
-        assert result["spd"] == 76
-        assert result["spe"] == 36
-
-    def test_parses_max_hp_speed(self):
-        """Test parsing common max HP/Speed spread."""
-        from smogon_vgc_mcp.fetcher.smogon import parse_spread
-
-        result = parse_spread("Timid:4/0/0/252/0/252")
-
-        assert result is not None
-        assert result["nature"] == "Timid"
-        assert result["hp"] == 4
-        assert result["atk"] == 0
-        assert result["def"] == 0
-        assert result["spa"] == 252
-        assert result["spd"] == 0
-        assert result["spe"] == 252
-
-    def test_parses_all_natures(self):
-        """Test parsing various nature names."""
-        from smogon_vgc_mcp.fetcher.smogon import parse_spread
-
-        natures = [
-            "Adamant",
-            "Jolly",
-            "Modest",
-            "Timid",
-            "Brave",
-            "Quiet",
-            "Bold",
-            "Impish",
-            "Calm",
-            "Careful",
-            "Sassy",
-            "Relaxed",
-            "Naive",
-            "Hasty",
-            "Hardy",
-        ]
-
-        for nature in natures:
-            spread = f"{nature}:252/4/0/0/0/252"
-            result = parse_spread(spread)
-            assert result is not None
-            assert result["nature"] == nature
+from smogon_vgc_mcp.data.pokemon_data import NATURE_MODIFIERS
+from smogon_vgc_mcp.fetcher.smogon import parse_spread
+from smogon_vgc_mcp.utils import STAT_ORDER
 
-    def test_returns_none_for_invalid_format(self):
-        """Test returning None for invalid format."""
-        from smogon_vgc_mcp.fetcher.smogon import parse_spread
 
-        # Missing nature
-        assert parse_spread("252/4/0/0/0/252") is None
-
-        # Wrong delimiter
-        assert parse_spread("Adamant-252/4/0/0/0/252") is None
-
-        # Missing EV values
-        assert parse_spread("Adamant:252/4/0") is None
-
-        # Non-numeric EVs
-        assert parse_spread("Adamant:abc/4/0/0/0/252") is None
-
-    def test_returns_none_for_empty_string(self):
-        """Test returning None for empty string."""
-        from smogon_vgc_mcp.fetcher.smogon import parse_spread
-
-        assert parse_spread("") is None
-
-    def test_handles_zero_evs(self):
-        """Test handling spreads with all zero EVs."""
-        from smogon_vgc_mcp.fetcher.smogon import parse_spread
-
-        result = parse_spread("Serious:0/0/0/0/0/0")
-
-        assert result is not None
-        assert result["nature"] == "Serious"
-        assert all(result[stat] == 0 for stat in ["hp", "atk", "def", "spa", "spd", "spe"])
-
-    def test_handles_max_evs(self):
-        """Test handling maximum EV investment."""
-        from smogon_vgc_mcp.fetcher.smogon import parse_spread
+class TestParseSpread:
+    """Tests for parse_spread function."""
 
-        result = parse_spread("Adamant:252/252/0/0/4/0")
+    @pytest.mark.parametrize(
+        ("spread", "expected"),
+        [
+            pytest.param(
+                "Careful:252/4/140/0/76/36", ("Careful", 252, 4, 140, 0, 76, 36), id="valid"
+            ),
+            pytest.param(
+                "Timid:4/0/0/252/0/252", ("Timid", 4, 0, 0, 252, 0, 252), id="max_hp_speed"
+            ),
+            pytest.param("Serious:0/0/0/0/0/0", ("Serious", 0, 0, 0, 0, 0, 0), id="zero_evs"),
+            pytest.param(
+                "Adamant:252/252/0/0/4/0", ("Adamant", 252, 252, 0, 0, 4, 0), id="max_evs"
+            ),
+        ],
+    )
+    def test_parses_spread(self, spread, expected):
+        """Test parsing nature and all six EVs from a spread string."""
+        assert parse_spread(spread) == dict(zip(("nature", *STAT_ORDER), expected))
+
+    @pytest.mark.parametrize("nature", sorted(NATURE_MODIFIERS))
+    def test_parses_all_natures(self, nature):
+        """Test parsing every nature name."""
+        result = parse_spread(f"{nature}:252/4/0/0/0/252")
 
         assert result is not None
-        assert result["hp"] == 252
-        assert result["atk"] == 252
-        assert result["spd"] == 4
+        assert result["nature"] == nature
+
+    @pytest.mark.parametrize(
+        "spread",
+        [
+            pytest.param("252/4/0/0/0/252", id="missing_nature"),
+            pytest.param("Adamant-252/4/0/0/0/252", id="wrong_delimiter"),
+            pytest.param("Adamant:252/4/0", id="missing_ev_values"),
+            pytest.param("Adamant:abc/4/0/0/0/252", id="non_numeric_evs"),
+            pytest.param("", id="empty_string"),
+        ],
+    )
+    def test_returns_none_for_invalid_spread(self, spread):
+        """Test returning None for malformed spread strings."""
+        assert parse_spread(spread) is None
 
 
 class TestSmogonDataStructure:
@@ -111,8 +57,6 @@ class TestSmogonDataStructure:
 
     def test_spread_total_evs_should_not_exceed_508(self):
         """Test that EV spreads are valid (total <= 508)."""
-        from smogon_vgc_mcp.fetcher.smogon import parse_spread
-
         # Valid common spreads
         spreads = [
             "Careful:252/4/0/0/252/0",  # 508
@@ -125,26 +69,15 @@ class TestSmogonDataStructure:
         for spread_str in spreads:
             result = parse_spread(spread_str)
             assert result is not None
-            total = sum(
-                [
-                    result["hp"],
-                    result["atk"],
-                    result["def"],
-                    result["spa"],
-                    result["spd"],
-                    result["spe"],
-                ]
-            )
+            total = sum(result[stat] for stat in STAT_ORDER)
             # EVs should not exceed 508 (though Smogon data might have edge cases)
             assert total <= 508
 
     def test_spread_individual_evs_should_not_exceed_252(self):
         """Test that individual EVs don't exceed 252."""
-        from smogon_vgc_mcp.fetcher.smogon import parse_spread
-
         # This is a valid spread
         result = parse_spread("Adamant:252/252/4/0/0/0")
         assert result is not None
 
-        for stat in ["hp", "atk", "def", "spa", "spd", "spe"]:
+        for stat in STAT_ORDER:
             assert result[stat] <= 252
@@ -122,23 +122,17 @@ class TestGetSmogonStatsURL:
         assert url.endswith(".json")
         assert "/chaos/" in url
 
-    def test_different_elo_brackets(self):
+    @pytest.mark.parametrize("elo", [0, 1500, 1760])
+    def test_different_elo_brackets(self, elo):
         """Test URL generation with different ELO brackets."""
-        url_0 = get_smogon_stats_url("regf", "2025-12", 0)
-        url_1500 = get_smogon_stats_url("regf", "2025-12", 1500)
-        url_1760 = get_smogon_stats_url("regf", "2025-12", 1760)
+        url = get_smogon_stats_url("regf", "2025-12", elo)
+        assert url.endswith(f"-{elo}.json")
 
-        assert "-0.json" in url_0
-        assert "-1500.json" in url_1500
-        assert "-1760.json" in url_1760
-
-    def test_different_months(self):
+    @pytest.mark.parametrize("month", ["2025-11", "2025-12"])
+    def test_different_months(self, month):
         """Test URL generation with different months."""
-        url_nov = get_smogon_stats_url("regf", "2025-11", 1500)
-        url_dec = get_smogon_stats_url("regf", "2025-12", 1500)
-
-        assert "2025-11" in url_nov
-        assert "2025-12" in url_dec
+        url = get_smogon_stats_url("regf", month, 1500)
+        assert f"/{month}/" in url
 
 
 class TestGetMovesetURL:
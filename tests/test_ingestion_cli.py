@@ -3,18 +3,10 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from smogon_vgc_mcp.database.schema import init_database
 from smogon_vgc_mcp.entry.ingest_cli import main_async
 from smogon_vgc_mcp.resilience import FetchResult
 
 
-@pytest.fixture
-async def db_path(tmp_path: Path):
-    p = tmp_path / "test.db"
-    await init_database(p)
-    return p
-
-
 async def test_cli_auto_write_exit_zero(db_path: Path, capsys):
     pokepaste_text = (
         "Koraidon @ Life Orb\nAbility: Orichalcum Pulse\nLevel: 50\nEVs: 32 Atk\n"
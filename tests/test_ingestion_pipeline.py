@@ -4,20 +4,13 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from smogon_vgc_mcp.database.champions_team_queries import get_champions_team
-from smogon_vgc_mcp.database.schema import get_connection, init_database
+from smogon_vgc_mcp.database.schema import get_connection
 from smogon_vgc_mcp.fetcher.ingestion.pipeline import ingest_url
 from smogon_vgc_mcp.resilience import FetchResult
 
 FIXTURE = Path(__file__).parent / "fixtures" / "champions_pokepaste_sample.txt"
 
 
-@pytest.fixture
-async def db_path(tmp_path: Path):
-    p = tmp_path / "test.db"
-    await init_database(p)
-    return p
-
-
 async def test_ingest_unknown_url_returns_rejected(db_path: Path):
     result = await ingest_url("not-a-url", db_path=db_path)
     assert result.status == "rejected"
@@ -9,7 +9,6 @@ from pathlib import Path
 import aiosqlite
 import pytest
 
-from smogon_vgc_mcp.database.schema import init_database
 from smogon_vgc_mcp.labeler import storage
 from smogon_vgc_mcp.labeler.autocomplete import load_autocomplete
 from smogon_vgc_mcp.labeler.sources import (
@@ -63,13 +62,13 @@ async def _seed(db: aiosqlite.Connection) -> None:
 
 
 @pytest.fixture
-async def labeler_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[Path]:
+async def labeler_db(
+    db_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> AsyncIterator[Path]:
     """Isolated SQLite DB seeded with labeler-relevant rows."""
-    db_path = tmp_path / "labeler.db"
     labels_dir = tmp_path / "labels"
     monkeypatch.setenv("SMOGON_VGC_DB_PATH", str(db_path))
     monkeypatch.setattr(storage, "DEFAULT_LABELS_DIR", labels_dir)
-    await init_database(db_path)
     async with aiosqlite.connect(db_path) as db:
         await _seed(db)
     yield db_path
@@ -1,8 +1,12 @@
 """Tests for Pokemon Showdown replay parser."""
 
+import ast
+import inspect
+
 import pytest
 
 from smogon_vgc_mcp.parser.replay import (
+    _HANDLED_COMMANDS,
     DamageEvent,
     FaintEvent,
     FieldEvent,
@@ -55,6 +59,18 @@ class TestPokemonModel:
         mon2 = Pokemon(species="Porygon-Z")
         assert mon2.base_species == "Porygon-Z"
 
+    def test_no_instance_dict(self):
+        """Test replay models are slotted."""
+        assert not hasattr(Pokemon(species="Incineroar"), "__dict__")
+
+    def test_base_species_follows_species_change(self):
+        """Test base_species is not stale after the species is reassigned."""
+        mon = Pokemon(species="Urshifu-Rapid-Strike")
+        assert mon.base_species == "Urshifu"
+
+        mon.species = "Kommo-o"
+        assert mon.base_species == "Kommo-o"
+
 
 class TestTeamModel:
     """Tests for Team data model."""
@@ -82,6 +98,46 @@ class TestTeamModel:
         team = Team(pokemon=[Pokemon(species="Incineroar")])
         assert team.get_pokemon("Charizard") is None
 
+    def test_get_pokemon_by_base_species(self):
+        """Test a forme is found by its base species, first match winning."""
+        team = Team(
+            pokemon=[
+                Pokemon(species="Urshifu-Rapid-Strike"),
+                Pokemon(species="Urshifu"),
+            ]
+        )
+        assert team.get_pokemon("urshifu") is team.pokemon[0]
+        assert team.get_pokemon("Urshifu-Rapid-Strike") is team.pokemon[0]
+
+    def test_get_pokemon_sees_appended_pokemon(self):
+        """Test Pokemon appended after a lookup are still found."""
+        team = Team(pokemon=[Pokemon(species="Incineroar")])
+        assert team.get_pokemon("Rillaboom") is None
+
+        team.pokemon.append(Pokemon(species="Rillaboom"))
+
+        assert team.get_pokemon("Rillaboom") is team.pokemon[1]
+
+    def test_get_pokemon_sees_replaced_pokemon(self):
+        """Test a Pokemon swapped into the roster in place is found."""
+        team = Team(pokemon=[Pokemon(species="Incineroar")])
+        assert team.get_pokemon("Incineroar") is team.pokemon[0]
+
+        team.pokemon[0] = Pokemon(species="Rillaboom")
+
+        assert team.get_pokemon("rillaboom") is team.pokemon[0]
+        assert team.get_pokemon("incineroar") is None
+
+    def test_get_pokemon_sees_species_reassignment(self):
+        """Test a Pokemon whose species changes is found under its new name."""
+        team = Team(pokemon=[Pokemon(species="Incineroar")])
+        assert team.get_pokemon("Incineroar") is team.pokemon[0]
+
+        team.pokemon[0].species = "Kommo-o"
+
+        assert team.get_pokemon("kommo-o") is team.pokemon[0]
+        assert team.get_pokemon("Incineroar") is None
+
     def test_team_length(self):
         """Test team length."""
         team = Team(pokemon=[Pokemon(species="A"), Pokemon(species="B")])
@@ -141,6 +197,37 @@ class TestTurn:
         assert len(turn.faints) == 1
         assert turn.faints[0].species == "Flutter Mane"
 
+    def test_filters_see_appended_events(self):
+        """Test events appended after a filter was read are picked up."""
+        turn = Turn(number=1)
+        assert turn.moves == []
+
+        turn.events.append(MoveEvent(turn=1, user="p1", user_species="Incineroar", move="Fake Out"))
+        turn.events.append(FaintEvent(turn=1, player="p2", species="Amoonguss"))
+
+        assert [m.move for m in turn.moves] == ["Fake Out"]
+        assert [f.species for f in turn.faints] == ["Amoonguss"]
+        assert turn.teras == []
+
+    def test_filters_see_replaced_events(self):
+        """Test an event replaced in place is reflected by the filters."""
+        turn = Turn(number=1)
+        turn.events.append(MoveEvent(turn=1, user="p1", user_species="Incineroar", move="X"))
+        assert [m.move for m in turn.moves] == ["X"]
+
+        turn.events[0] = MoveEvent(turn=1, user="p1", user_species="Incineroar", move="Y")
+
+        assert [m.move for m in turn.moves] == ["Y"]
+
+    def test_filters_return_fresh_lists(self):
+        """Test mutating a filter result does not affect the turn."""
+        turn = Turn(number=1)
+        turn.events.append(FaintEvent(turn=1, player="p2", species="Amoonguss"))
+
+        turn.faints.append(FaintEvent(turn=1, player="p2", species="Rillaboom"))
+
+        assert [f.species for f in turn.faints] == ["Amoonguss"]
+
 
 class TestReplay:
     """Tests for Replay data model."""
@@ -263,6 +350,40 @@ class TestParseReplay:
         assert replay.player2.rating == 1600
         assert replay.format == "[Gen 9] VGC 2026 Reg F"
 
+    def test_skips_unhandled_messages(self):
+        """Test chat, join and animation lines do not disturb parsing."""
+        log = """|j|☆TestPlayer1
+|player|p1|TestPlayer1|avatar|1500
+|c|☆TestPlayer1|glhf
+|player|p2|TestPlayer2|avatar|1600
+|-anim|p1a: Incineroar|Fake Out|p2a: Urshifu
+|upkeep
+|win|TestPlayer2
+"""
+        replay = parse_replay(log, "test-123")
+        assert replay.player1.name == "TestPlayer1"
+        assert replay.player2.name == "TestPlayer2"
+        assert replay.winner == "TestPlayer2"
+
+    def test_handled_commands_match_dispatch_chain(self):
+        """Test every command the dispatch chain compares against is let through."""
+        tree = ast.parse(inspect.getsource(parse_replay))
+        dispatched = set()
+        for node in ast.walk(tree):
+            if not (
+                isinstance(node, ast.Compare)
+                and isinstance(node.left, ast.Name)
+                and node.left.id == "cmd"
+            ):
+                continue
+            op, right = node.ops[0], node.comparators[0]
+            if isinstance(op, ast.Eq) and isinstance(right, ast.Constant):
+                dispatched.add(right.value)
+            elif isinstance(op, ast.In) and isinstance(right, ast.Tuple):
+                dispatched.update(elt.value for elt in right.elts)
+
+        assert dispatched == _HANDLED_COMMANDS
+
     def test_parse_team_preview(self):
         """Test parsing team preview."""
         log = """|player|p1|Player1|avatar|1500
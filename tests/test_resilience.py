@@ -1,6 +1,8 @@
 """Tests for resilience patterns (circuit breaker, error types)."""
 
+import threading
 from datetime import timedelta
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import httpx
@@ -13,6 +15,7 @@ from smogon_vgc_mcp.resilience import (
     ErrorCategory,
     FetchResult,
     ServiceError,
+    circuit_breaker,
 )
 from smogon_vgc_mcp.utils.http_client import _classify_error
 
@@ -55,6 +58,10 @@ class TestServiceError:
         assert result["status_code"] == 404
         assert result["is_recoverable"] is False
 
+    def test_no_instance_dict(self):
+        error = ServiceError(category=ErrorCategory.NETWORK, service="smogon", message="reset")
+        assert not hasattr(error, "__dict__")
+
 
 class TestFetchResult:
     def test_ok_result(self):
@@ -130,6 +137,42 @@ class TestCircuitBreaker:
         assert breaker.state == CircuitState.HALF_OPEN
         assert breaker.can_execute() is True
 
+    def test_recovery_uses_monotonic_clock(self, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr(
+            "smogon_vgc_mcp.resilience.circuit_breaker.time",
+            SimpleNamespace(monotonic=lambda: clock[0]),
+        )
+        config = CircuitBreakerConfig(
+            failure_threshold=1,
+            recovery_timeout=timedelta(seconds=60),
+        )
+        breaker = CircuitBreaker("test", config)
+
+        breaker.record_failure()
+        clock[0] += 59
+        assert breaker.state == CircuitState.OPEN
+
+        clock[0] += 1
+        assert breaker.state == CircuitState.HALF_OPEN
+
+    def test_recovery_follows_config_changes(self, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr(
+            "smogon_vgc_mcp.resilience.circuit_breaker.time",
+            SimpleNamespace(monotonic=lambda: clock[0]),
+        )
+        config = CircuitBreakerConfig(
+            failure_threshold=1,
+            recovery_timeout=timedelta(seconds=60),
+        )
+        breaker = CircuitBreaker("test", config)
+
+        breaker.record_failure()
+        config.recovery_timeout = timedelta(seconds=10)
+        clock[0] += 10
+        assert breaker.state == CircuitState.HALF_OPEN
+
     def test_closes_after_success_in_half_open(self):
         config = CircuitBreakerConfig(
             failure_threshold=2,
@@ -197,6 +240,40 @@ class TestCircuitBreakerRegistry:
         registry2 = CircuitBreakerRegistry()
         assert registry1 is registry2
 
+    def test_concurrent_first_construction(self, monkeypatch):
+        """A caller racing the first construction never sees a half-built registry."""
+        monkeypatch.setattr(CircuitBreakerRegistry, "_instance", None)
+        constructing = threading.Event()
+        racer_done = threading.Event()
+        real_lock = circuit_breaker.Lock
+
+        def slow_lock():
+            # Hold the constructing thread mid-initialisation while the racer runs
+            constructing.set()
+            racer_done.wait(timeout=0.2)
+            return real_lock()
+
+        monkeypatch.setattr(circuit_breaker, "Lock", slow_lock)
+        errors = []
+
+        def racer():
+            constructing.wait()
+            try:
+                CircuitBreakerRegistry().get_breaker("race_service")
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                racer_done.set()
+
+        thread = threading.Thread(target=racer)
+        thread.start()
+        registry = CircuitBreakerRegistry()
+        thread.join()
+
+        assert errors == []
+        assert CircuitBreakerRegistry() is registry
+        assert "race_service" in registry.get_all_states()
+
     def test_get_breaker_creates_if_not_exists(self):
         registry = CircuitBreakerRegistry()
         registry.reset_all()
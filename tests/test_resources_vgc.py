@@ -15,6 +15,7 @@ from smogon_vgc_mcp.database.models import (
     TeammateUsage,
     UsageRanking,
 )
+from smogon_vgc_mcp.resources.vgc import register_vgc_resources
 
 
 # Create mock FastMCP for testing resources
@@ -32,17 +33,16 @@ class MockFastMCP:
         return decorator
 
 
-class TestPokemonResource:
-    """Tests for pokemon resource."""
+@pytest.fixture(scope="module")
+def mock_mcp():
+    """Register the resources once; handlers look up patched queries at call time."""
+    mcp = MockFastMCP()
+    register_vgc_resources(mcp)
+    return mcp
 
-    @pytest.fixture
-    def mock_mcp(self):
-        """Create mock MCP and register resources."""
-        from smogon_vgc_mcp.resources.vgc import register_vgc_resources
 
-        mcp = MockFastMCP()
-        register_vgc_resources(mcp)
-        return mcp
+class TestPokemonResource:
+    """Tests for pokemon resource."""
 
     @pytest.mark.asyncio
     @patch("smogon_vgc_mcp.resources.vgc.get_pokemon_stats")
@@ -85,15 +85,6 @@ class TestPokemonResource:
 class TestRankingsResource:
     """Tests for rankings resource."""
 
-    @pytest.fixture
-    def mock_mcp(self):
-        """Create mock MCP and register resources."""
-        from smogon_vgc_mcp.resources.vgc import register_vgc_resources
-
-        mcp = MockFastMCP()
-        register_vgc_resources(mcp)
-        return mcp
-
     @pytest.mark.asyncio
     @patch("smogon_vgc_mcp.resources.vgc.get_usage_rankings")
     async def test_returns_rankings(self, mock_get_rankings, mock_mcp):
@@ -138,15 +129,6 @@ class TestRankingsResource:
 class TestStatusResource:
     """Tests for status resource."""
 
-    @pytest.fixture
-    def mock_mcp(self):
-        """Create mock MCP and register resources."""
-        from smogon_vgc_mcp.resources.vgc import register_vgc_resources
-
-        mcp = MockFastMCP()
-        register_vgc_resources(mcp)
-        return mcp
-
     @pytest.mark.asyncio
     @patch("smogon_vgc_mcp.resources.vgc.get_all_snapshots")
     async def test_returns_status_when_data_exists(self, mock_get_snapshots, mock_mcp):
@@ -1,20 +1,9 @@
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
-import pytest
-
-from smogon_vgc_mcp.database.schema import init_database
 from smogon_vgc_mcp.fetcher.sheets import ingest_champions_sheet
 from smogon_vgc_mcp.resilience import FetchResult
 
-
-@pytest.fixture
-async def db_path(tmp_path: Path):
-    p = tmp_path / "test.db"
-    await init_database(p)
-    return p
-
-
 MIXED_SHEET_CSV = """Owner,Tournament,Rank,URL
 Alice,Regional A,Top 8,https://pokepast.es/abc123
 Bob,Regional B,Winner,https://x.com/bob/status/42
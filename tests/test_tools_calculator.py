@@ -1,9 +1,12 @@
 """Tests for tools/calculator.py - Calculator tools."""
 
-from unittest.mock import patch
-
 import pytest
 
+from smogon_vgc_mcp.tools import calculator
+from smogon_vgc_mcp.tools.calculator import register_calculator_tools
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 
 # Create mock FastMCP for testing
 class MockFastMCP:
@@ -20,24 +23,22 @@ class MockFastMCP:
         return decorator
 
 
-class TestCalculatePokemonStats:
-    """Tests for calculate_pokemon_stats tool."""
+@pytest.fixture(scope="module")
+def mock_mcp():
+    """Register the tools once; tests only read from the registry."""
+    mcp = MockFastMCP()
+    register_calculator_tools(mcp)
+    return mcp
 
-    @pytest.fixture
-    def mock_mcp(self):
-        """Create mock MCP and register tools."""
-        from smogon_vgc_mcp.tools.calculator import register_calculator_tools
 
-        mcp = MockFastMCP()
-        register_calculator_tools(mcp)
-        return mcp
+class TestCalculatePokemonStats:
+    """Tests for calculate_pokemon_stats tool."""
 
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.tools.calculator.format_stats")
-    @patch("smogon_vgc_mcp.tools.calculator.calculate_all_stats")
-    @patch("smogon_vgc_mcp.tools.calculator.get_base_stats")
-    async def test_returns_calculated_stats(self, mock_base, mock_calc, mock_format, mock_mcp):
+    async def test_returns_calculated_stats(self, mock_mcp, stub):
         """Test returning calculated stats."""
+        mock_base = stub(calculator, "get_base_stats")
+        mock_calc = stub(calculator, "calculate_all_stats")
+        mock_format = stub(calculator, "format_stats")
         mock_base.return_value = {"hp": 95, "atk": 115, "def": 90, "spa": 80, "spd": 90, "spe": 60}
         mock_calc.return_value = {
             "hp": 202,
@@ -56,10 +57,9 @@ class TestCalculatePokemonStats:
         assert result["nature"] == "Careful"
         assert result["calculated_stats"]["hp"] == 202
 
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.tools.calculator.get_base_stats")
-    async def test_returns_error_when_pokemon_not_found(self, mock_base, mock_mcp):
+    async def test_returns_error_when_pokemon_not_found(self, mock_mcp, stub):
         """Test returning error when Pokemon not found."""
+        mock_base = stub(calculator, "get_base_stats")
         mock_base.return_value = None
 
         calculate_pokemon_stats = mock_mcp.tools["calculate_pokemon_stats"]
@@ -68,11 +68,10 @@ class TestCalculatePokemonStats:
         assert "error" in result
         assert "not found" in result["error"]
 
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.tools.calculator.calculate_all_stats")
-    @patch("smogon_vgc_mcp.tools.calculator.get_base_stats")
-    async def test_returns_error_when_calc_fails(self, mock_base, mock_calc, mock_mcp):
+    async def test_returns_error_when_calc_fails(self, mock_mcp, stub):
         """Test returning error when calculation fails."""
+        mock_base = stub(calculator, "get_base_stats")
+        mock_calc = stub(calculator, "calculate_all_stats")
         mock_base.return_value = {"hp": 95, "atk": 115, "def": 90, "spa": 80, "spd": 90, "spe": 60}
         mock_calc.return_value = None
 
@@ -85,19 +84,9 @@ class TestCalculatePokemonStats:
 class TestComparePokemonSpeeds:
     """Tests for compare_pokemon_speeds tool."""
 
-    @pytest.fixture
-    def mock_mcp(self):
-        """Create mock MCP and register tools."""
-        from smogon_vgc_mcp.tools.calculator import register_calculator_tools
-
-        mcp = MockFastMCP()
-        register_calculator_tools(mcp)
-        return mcp
-
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.tools.calculator.compare_speeds")
-    async def test_returns_speed_comparison(self, mock_compare, mock_mcp):
+    async def test_returns_speed_comparison(self, mock_mcp, stub):
         """Test returning speed comparison."""
+        mock_compare = stub(calculator, "compare_speeds")
         mock_compare.return_value = {
             "pokemon1": {"name": "Flutter Mane", "speed": 205, "nature": "Timid"},
             "pokemon2": {"name": "Incineroar", "speed": 80, "nature": "Careful"},
@@ -118,20 +107,10 @@ class TestComparePokemonSpeeds:
 class TestGetSpeedBenchmarks:
     """Tests for get_speed_benchmarks tool."""
 
-    @pytest.fixture
-    def mock_mcp(self):
-        """Create mock MCP and register tools."""
-        from smogon_vgc_mcp.tools.calculator import register_calculator_tools
-
-        mcp = MockFastMCP()
-        register_calculator_tools(mcp)
-        return mcp
-
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.tools.calculator.find_speed_benchmarks")
-    @patch("smogon_vgc_mcp.tools.calculator.get_speed_stat")
-    async def test_returns_benchmarks(self, mock_get_speed, mock_find_bench, mock_mcp):
+    async def test_returns_benchmarks(self, mock_mcp, stub):
         """Test returning speed benchmarks."""
+        mock_get_speed = stub(calculator, "get_speed_stat")
+        mock_find_bench = stub(calculator, "find_speed_benchmarks")
         mock_get_speed.return_value = 205
         mock_find_bench.return_value = {
             "pokemon": "Flutter Mane",
@@ -147,10 +126,9 @@ class TestGetSpeedBenchmarks:
         assert result["speed_stat"] == 205
         assert "outspeeds_max" in result
 
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.tools.calculator.get_speed_stat")
-    async def test_returns_error_when_calc_fails(self, mock_get_speed, mock_mcp):
+    async def test_returns_error_when_calc_fails(self, mock_mcp, stub):
         """Test returning error when calculation fails."""
+        mock_get_speed = stub(calculator, "get_speed_stat")
         mock_get_speed.return_value = None
 
         get_speed_benchmarks = mock_mcp.tools["get_speed_benchmarks"]
@@ -162,19 +140,9 @@ class TestGetSpeedBenchmarks:
 class TestAnalyzeTeamTypeCoverage:
     """Tests for analyze_team_type_coverage tool."""
 
-    @pytest.fixture
-    def mock_mcp(self):
-        """Create mock MCP and register tools."""
-        from smogon_vgc_mcp.tools.calculator import register_calculator_tools
-
-        mcp = MockFastMCP()
-        register_calculator_tools(mcp)
-        return mcp
-
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.tools.calculator.analyze_team_types")
-    async def test_returns_team_analysis(self, mock_analyze, mock_mcp):
+    async def test_returns_team_analysis(self, mock_mcp, stub):
         """Test returning team type analysis."""
+        mock_analyze = stub(calculator, "analyze_team_types")
         mock_analyze.return_value = {
             "team": ["Incineroar", "Flutter Mane"],
             "pokemon_types": {
@@ -195,19 +163,9 @@ class TestAnalyzeTeamTypeCoverage:
 class TestAnalyzeMoveCoverage:
     """Tests for analyze_move_coverage tool."""
 
-    @pytest.fixture
-    def mock_mcp(self):
-        """Create mock MCP and register tools."""
-        from smogon_vgc_mcp.tools.calculator import register_calculator_tools
-
-        mcp = MockFastMCP()
-        register_calculator_tools(mcp)
-        return mcp
-
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.tools.calculator.get_offensive_coverage")
-    async def test_returns_coverage(self, mock_coverage, mock_mcp):
+    async def test_returns_coverage(self, mock_mcp, stub):
         """Test returning move coverage."""
+        mock_coverage = stub(calculator, "get_offensive_coverage")
         mock_coverage.return_value = {
             "move_types": ["Fire", "Dark"],
             "super_effective_against": ["Grass", "Ghost", "Psychic"],
@@ -224,16 +182,6 @@ class TestAnalyzeMoveCoverage:
 class TestCalculatorBoundary:
     """Boundary and error tests for calculator tools."""
 
-    @pytest.fixture
-    def mock_mcp(self):
-        """Create mock MCP and register tools."""
-        from smogon_vgc_mcp.tools.calculator import register_calculator_tools
-
-        mcp = MockFastMCP()
-        register_calculator_tools(mcp)
-        return mcp
-
-    @pytest.mark.asyncio
     async def test_calculate_stats_invalid_nature(self, mock_mcp):
         """Test invalid nature returns error."""
         calculate_pokemon_stats = mock_mcp.tools["calculate_pokemon_stats"]
@@ -241,10 +189,9 @@ class TestCalculatorBoundary:
 
         assert "error" in result
 
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.tools.calculator.compare_speeds")
-    async def test_compare_speeds_same_pokemon(self, mock_compare, mock_mcp):
+    async def test_compare_speeds_same_pokemon(self, mock_mcp, stub):
         """Test same Pokemon comparison."""
+        mock_compare = stub(calculator, "compare_speeds")
         mock_compare.return_value = {
             "pokemon1": {"name": "Incineroar", "speed": 80, "nature": "Careful"},
             "pokemon2": {"name": "Incineroar", "speed": 80, "nature": "Careful"},
@@ -260,10 +207,9 @@ class TestCalculatorBoundary:
 
         assert result["difference"] == 0
 
-    @pytest.mark.asyncio
-    @patch("smogon_vgc_mcp.tools.calculator.analyze_team_types")
-    async def test_analyze_team_single_pokemon(self, mock_analyze, mock_mcp):
+    async def test_analyze_team_single_pokemon(self, mock_mcp, stub):
         """Test team of 1 Pokemon."""
+        mock_analyze = stub(calculator, "analyze_team_types")
         mock_analyze.return_value = {
             "team": ["Incineroar"],
             "pokemon_types": {"Incineroar": ["Fire", "Dark"]},
@@ -276,7 +222,6 @@ class TestCalculatorBoundary:
 
         assert len(result["team"]) == 1
 
-    @pytest.mark.asyncio
     async def test_analyze_move_coverage_empty_types(self, mock_mcp):
         """Test empty type list returns error."""
         analyze_move_coverage = mock_mcp.tools["analyze_move_coverage"]
@@ -4,6 +4,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from smogon_vgc_mcp.database.models import TeamPokemon
+
 
 # Create mock FastMCP for testing
 class MockFastMCP:
@@ -37,29 +39,21 @@ class TestGetTournamentTeam:
     async def test_returns_team_details(self, mock_get_team, mock_mcp):
         """Test returning full team details."""
         # Create mock team with Pokemon
-        mock_pokemon = MagicMock()
-        mock_pokemon.slot = 1
-        mock_pokemon.pokemon = "Incineroar"
-        mock_pokemon.item = "Safety Goggles"
-        mock_pokemon.ability = "Intimidate"
-        mock_pokemon.tera_type = "Ghost"
-        mock_pokemon.nature = "Careful"
-        mock_pokemon.hp_ev = 252
-        mock_pokemon.atk_ev = 4
-        mock_pokemon.def_ev = 0
-        mock_pokemon.spa_ev = 0
-        mock_pokemon.spd_ev = 252
-        mock_pokemon.spe_ev = 0
-        mock_pokemon.hp_iv = 31
-        mock_pokemon.atk_iv = 31
-        mock_pokemon.def_iv = 31
-        mock_pokemon.spa_iv = 31
-        mock_pokemon.spd_iv = 31
-        mock_pokemon.spe_iv = 31
-        mock_pokemon.move1 = "Fake Out"
-        mock_pokemon.move2 = "Knock Off"
-        mock_pokemon.move3 = "Flare Blitz"
-        mock_pokemon.move4 = "Parting Shot"
+        team_pokemon = TeamPokemon(
+            slot=1,
+            pokemon="Incineroar",
+            item="Safety Goggles",
+            ability="Intimidate",
+            tera_type="Ghost",
+            nature="Careful",
+            hp_ev=252,
+            atk_ev=4,
+            spd_ev=252,
+            move1="Fake Out",
+            move2="Knock Off",
+            move3="Flare Blitz",
+            move4="Parting Shot",
+        )
 
         mock_team = MagicMock()
         mock_team.team_id = "F123"
@@ -69,7 +63,7 @@ class TestGetTournamentTeam:
         mock_team.rank = "Top 8"
         mock_team.rental_code = "ABC123"
         mock_team.pokepaste_url = "https://pokepast.es/123"
-        mock_team.pokemon = [mock_pokemon]
+        mock_team.pokemon = [team_pokemon]
 
         mock_get_team.return_value = mock_team
 
@@ -121,8 +115,7 @@ class TestSearchTournamentTeams:
     @patch("smogon_vgc_mcp.tools.teams.search_teams")
     async def test_returns_matching_teams(self, mock_search, mock_mcp):
         """Test returning matching teams."""
-        mock_pokemon = MagicMock()
-        mock_pokemon.pokemon = "Incineroar"
+        team_pokemon = TeamPokemon(slot=1, pokemon="Incineroar")
 
         mock_team = MagicMock()
         mock_team.team_id = "F123"
@@ -131,7 +124,7 @@ class TestSearchTournamentTeams:
         mock_team.tournament = "Worlds"
         mock_team.rank = "Top 8"
         mock_team.rental_code = "ABC123"
-        mock_team.pokemon = [mock_pokemon]
+        mock_team.pokemon = [team_pokemon]
 
         mock_search.return_value = [mock_team]
 
@@ -229,10 +222,8 @@ class TestFindTeamsWithPokemonCore:
     @patch("smogon_vgc_mcp.tools.teams.get_teams_with_core")
     async def test_returns_teams_with_core(self, mock_get_core, mock_mcp):
         """Test returning teams with Pokemon core."""
-        mock_pokemon1 = MagicMock()
-        mock_pokemon1.pokemon = "Incineroar"
-        mock_pokemon2 = MagicMock()
-        mock_pokemon2.pokemon = "Flutter Mane"
+        team_pokemon1 = TeamPokemon(slot=1, pokemon="Incineroar")
+        team_pokemon2 = TeamPokemon(slot=2, pokemon="Flutter Mane")
 
         mock_team = MagicMock()
         mock_team.team_id = "F123"
@@ -241,7 +232,7 @@ class TestFindTeamsWithPokemonCore:
         mock_team.tournament = "Worlds"
         mock_team.rank = "Top 8"
         mock_team.rental_code = "ABC123"
-        mock_team.pokemon = [mock_pokemon1, mock_pokemon2]
+        mock_team.pokemon = [team_pokemon1, team_pokemon2]
 
         mock_get_core.return_value = [mock_team]
 